@@ -21,10 +21,15 @@
 """
 
 import sys
+import os
 from pathlib import Path
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
 import pandas as pd
+import numpy as np
 import sqlite3
 import time
 from datetime import datetime, timedelta
@@ -32,13 +37,19 @@ import re
 import json
 from urllib.parse import urljoin, quote
 from tqdm import tqdm
-import random
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import asyncio
+import atexit
+import argparse
+import functools
+import itertools
 import threading
+import queue
 import difflib
-from collections import Counter
+import hashlib
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
 import unicodedata
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Set, Tuple
 import logging
 
 # 프로젝트 루트를 Python 경로에 추가
@@ -53,6 +64,62 @@ except ImportError as e:
     print(f"❌ 패키지 설치 필요: {e}")
     exit(1)
 
+try:
+    import aiohttp
+except ImportError:
+    # aiohttp가 없으면 스레드 기반 수집으로 동작
+    aiohttp = None
+
+try:
+    from lxml import etree
+    from lxml import html as lxml_html
+    HTML_PARSER = 'lxml'
+    
+    # 뉴스 목록 페이지용 XPath (모듈 로드 시 한 번만 컴파일)
+    _HAS_CLASS = "contains(concat(' ', normalize-space(@class), ' '), ' {} ')"
+    NEWS_ROW_XPATH = etree.XPath(f"//*[{_HAS_CLASS.format('tb_cont')}]//tr")
+    NEWS_TITLE_LINK_XPATH = etree.XPath(f".//*[{_HAS_CLASS.format('title')}]//a")
+    NEWS_DATE_XPATH = etree.XPath(f".//*[{_HAS_CLASS.format('date')}]")
+    NEWS_INFO_XPATH = etree.XPath(f".//*[{_HAS_CLASS.format('info')}]")
+    
+    # 본문 페이지에서 제거할 요소
+    NEWS_UNWANTED_XPATH = etree.XPath(".//script | .//style | .//iframe | .//ins | .//aside | .//nav | .//footer")
+    NEWS_CLASSED_XPATH = etree.XPath(".//*[@class]")
+except ImportError:
+    # lxml이 없으면 BeautifulSoup 내장 파서 사용
+    lxml_html = None
+    HTML_PARSER = 'html.parser'
+
+try:
+    import ahocorasick
+except ImportError:
+    # pyahocorasick이 없으면 단어별 부분 문자열 검사로 동작
+    ahocorasick = None
+
+try:
+    import hyperscan
+except ImportError:
+    # Hyperscan이 없으면 Aho-Corasick 오토마톤으로 감정 사전 검색
+    hyperscan = None
+
+try:
+    from numba import njit
+except ImportError:
+    # numba가 없으면 NumPy 벡터 연산으로 감정 점수 집계
+    njit = None
+
+try:
+    from rapidfuzz import fuzz, process as fuzz_process
+except ImportError:
+    # rapidfuzz가 없으면 difflib.SequenceMatcher로 제목 유사도 계산
+    fuzz = None
+
+try:
+    import xxhash
+except ImportError:
+    # xxhash가 없으면 hashlib.blake2b로 내용 지문 계산
+    xxhash = None
+
 # 로깅 설정 (한글 인코딩 완전 해결)
 logging.basicConfig(
     level=logging.INFO,
@@ -64,6 +131,254 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 날짜/문장 분리용 정규식 (모듈 로드 시 한 번만 컴파일)
+DATE_MMDD_TIME_RE = re.compile(r'^(\d{2})\.(\d{2}) (\d{2}:\d{2})')
+DATE_MMDD_RE = re.compile(r'^(\d{2})\.(\d{2})$')
+DATE_YYYYMMDD_RE = re.compile(r'^(\d{4})\.(\d{2})\.(\d{2})(?: (\d{2}:\d{2}))?')
+SENTENCE_SPLIT_RE = re.compile(r'[.!?]\s+')
+AD_CLASS_RE = re.compile(r'(ad|advertisement|related|recommend|banner)')
+
+# 뉴스 품질 검증용 정규식 (NewsQualityValidator)
+SPAM_SPECIAL_CHAR_RE = re.compile(r'[!@#$%^&*()+=\[\]{}|\\:";\'<>?,./]')
+DIGIT_RE = re.compile(r'\d')
+SENTENCE_END_RE = re.compile(r'[.!?]')
+HANGUL_WORD_RE = re.compile(r'[가-힣]+')
+NON_WORD_RE = re.compile(r'[^\w\s가-힣]')
+# 깨진 문자 패턴 (한 번의 탐색으로 모두 검사하도록 하나의 정규식으로 결합)
+BROKEN_TEXT_RE = re.compile('|'.join(f'(?:{pattern})' for pattern in (
+    r'[^\w\s가-힣ㄱ-ㅎㅏ-ㅣ.,!?()[\]{}:;"\'-]',  # 비정상 문자
+    r'(?:[��]{2,})',  # 연속된 깨진 문자
+    r'(?:&[a-zA-Z]+;){3,}',  # 과도한 HTML 엔티티
+    r'[?]{3,}',  # 연속된 물음표 (깨진 문자)
+)))
+
+# 본문 정제용 정규식 (_advanced_text_cleaning)
+HTML_TAG_RE = re.compile(r'<[^>]+>')
+HTML_ENTITY_RE = re.compile(r'&[a-zA-Z0-9#]+;')
+BOILERPLATE_RES = tuple(re.compile(pattern, re.IGNORECASE | re.DOTALL) for pattern in (
+    r'// flash 오류를 우회하기 위한 함수 추가.*',
+    r'본\s*기사는.*?입니다',
+    r'저작권자.*?무단.*?금지',
+    r'ⓒ.*?무단.*?금지',
+    r'Copyright.*?All.*?rights.*?reserved',
+    r'기자\s*=.*?기자',
+    r'^\s*\[.*?\]\s*',
+    r'\s*\[.*?\]\s*$',
+    r'이\s*메일.*?보내기',
+    r'카카오톡.*?공유',
+    r'페이스북.*?공유',
+    r'트위터.*?공유',
+    r'무단전재.*?금지',
+    r'네이버.*?블로그',
+    r'관련.*?뉴스',
+    r'이전.*?기사',
+    r'다음.*?기사',
+    # '.*?구독.*?알림', '.*?팔로우.*?'와 같은 결과 (문서 처음부터 마지막 일치 위치까지 제거)
+    # 선두 .*?는 시작 위치마다 문서 끝까지 재탐색하므로 문서 시작에 고정
+    r'\A(?:.*?구독.*?알림)+',
+    r'\A.*팔로우',
+    r'광고.*?문의',
+    r'제보.*?tip',
+    r'더보기.*?클릭',
+    r'동영상.*?보기'
+))
+SPECIAL_CHAR_RE = re.compile(r'[&\[\]{}()\*\+\?\|\^\$\\.~`!@#%=:;",<>]')
+DIGIT_HANGUL_RE = re.compile(r'(\d)([가-힣])')
+HANGUL_DIGIT_RE = re.compile(r'([가-힣])(\d)')
+REPEATED_WORD_RE = re.compile(r'([가-힣A-Za-z0-9]{2,})\1{2,}')
+REPEATING_PATTERN_RES = tuple(re.compile(f'(.{{{length}}})(\\1)+') for length in range(3, 20))
+WHITESPACE_RE = re.compile(r'\s+')
+
+# 감정 라벨 정수 코드 (news_articles.sentiment_label_id)
+SENTIMENT_LABEL_IDS = {'positive': 1, 'neutral': 0, 'negative': -1}
+
+# SQLite 성능 설정 (WAL + 완화된 동기화 + 큰 페이지 캐시)
+SQLITE_PRAGMAS = """
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-65536;
+    PRAGMA mmap_size=268435456;
+"""
+
+# 읽기 전용 연결용 PRAGMA (저널 모드 변경 없이 캐시 관련 설정만)
+SQLITE_READ_PRAGMAS = """
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-65536;
+    PRAGMA mmap_size=268435456;
+"""
+
+# 연결별 prepared statement 캐시 크기 (기본 128 → 보고용 쿼리와 다중 행 INSERT까지 유지)
+SQLITE_CACHED_STATEMENTS = 256
+
+# 스레드별 읽기 전용 연결 캐시 (DB 경로 → 연결)
+_read_connections = threading.local()
+
+# 다중 행 INSERT 한 문장에 묶을 최대 행 수
+# (바인드 변수 한도: SQLite 3.32+ 32766개, 이전 버전 999개)
+SQLITE_MAX_VARIABLES = 32766 if sqlite3.sqlite_version_info >= (3, 32, 0) else 999
+MULTI_ROW_INSERT_MAX_ROWS = 500
+
+
+def connect_news_db(db_path):
+    """🗄️ 성능 PRAGMA가 적용된 뉴스 DB 연결 생성"""
+    conn = sqlite3.connect(db_path, cached_statements=SQLITE_CACHED_STATEMENTS)
+    conn.executescript(SQLITE_PRAGMAS)
+    return conn
+
+
+def insert_rows_multi(cursor, insert_head, rows, cols_per_row):
+    """
+    🗄️ 여러 행을 ``INSERT ... VALUES (...), (...), ...`` 한 문장씩 묶어 저장
+    
+    executemany는 행마다 문장을 다시 실행하므로, 청크 단위로 VALUES를 펼쳐
+    문장 실행 횟수를 줄입니다. 트랜잭션 관리는 호출하는 쪽에서 합니다.
+    """
+    chunk_rows = max(1, min(MULTI_ROW_INSERT_MAX_ROWS, SQLITE_MAX_VARIABLES // cols_per_row))
+    row_placeholder = '(' + ', '.join(['?'] * cols_per_row) + ')'
+    full_sql = None
+    
+    for start in range(0, len(rows), chunk_rows):
+        chunk = rows[start:start + chunk_rows]
+        if len(chunk) == chunk_rows:
+            # 꽉 찬 청크는 같은 SQL 문자열을 재사용 (문장 캐시 적중)
+            if full_sql is None:
+                full_sql = insert_head + ', '.join([row_placeholder] * chunk_rows)
+            sql = full_sql
+        else:
+            sql = insert_head + ', '.join([row_placeholder] * len(chunk))
+        cursor.execute(sql, list(itertools.chain.from_iterable(chunk)))
+
+
+def get_read_connection(db_path):
+    """
+    🗄️ 현재 스레드의 읽기 전용 뉴스 DB 연결 (스레드별로 한 번만 열고 재사용)
+    
+    조회마다 연결을 새로 여는 비용을 없애고 페이지 캐시를 조회 간에 유지합니다.
+    WAL 모드라 다른 연결의 커밋 내용도 다음 조회부터 바로 보입니다.
+    """
+    connections = getattr(_read_connections, 'by_path', None)
+    if connections is None:
+        connections = _read_connections.by_path = {}
+    
+    key = str(db_path)
+    conn = connections.get(key)
+    if conn is None:
+        conn = sqlite3.connect(f'{Path(db_path).resolve().as_uri()}?mode=ro', uri=True,
+                               cached_statements=SQLITE_CACHED_STATEMENTS)
+        conn.executescript(SQLITE_READ_PRAGMAS)
+        connections[key] = conn
+    
+    return conn
+
+
+def content_fingerprint(text):
+    """
+    정규화된 본문의 64비트 지문 (내장 hash()와 달리 실행마다 값이 바뀌지 않음)
+    
+    SQLite INTEGER 범위에 맞도록 부호 있는 정수로 반환합니다.
+    """
+    data = text.encode('utf-8')
+    if xxhash is not None:
+        digest = xxhash.xxh3_64_digest(data)
+    else:
+        digest = hashlib.blake2b(data, digest_size=8).digest()
+    return int.from_bytes(digest, 'big', signed=True)
+
+
+def news_title_hash(title, source, published_date):
+    """
+    제목 중복 판정용 64비트 지문 (정규화된 제목 + 출처 + 발행일)
+    
+    URL만 다른 동일 기사(재전송/모바일 링크 등)를 (stock_code, title_hash) UNIQUE 인덱스로
+    걸러내는 데 사용합니다. 같은 기사라도 종목이 다르면 종목별로 한 행씩 저장됩니다.
+    """
+    normalized_title = ' '.join(unicodedata.normalize('NFKC', title or '').split()).lower()
+    return content_fingerprint(f"{normalized_title}\x1f{source or ''}\x1f{(published_date or '')[:10]}")
+
+
+def normalize_news_text(title, summary):
+    """감정 분석용 정규화 텍스트 (제목 + 요약, 소문자)"""
+    return f"{title or ''} {summary or ''}".lower()
+
+
+def migrate_news_schema(conn):
+    """
+    🗄️ 기존 뉴스 DB에 새 컬럼 추가 후 기존 데이터로 채움
+    
+    - sentiment_label_id: 정수 감정 라벨 (sentiment_label 기준)
+    - text_norm: 감정 분석용 정규화 텍스트 (제목 + 요약)
+    - title_hash: 제목 중복 판정용 지문 (종목 안에서 중복된 행은 가장 먼저 저장된 행만 값을 가짐)
+    """
+    columns = {row[1] for row in conn.execute('PRAGMA table_info(news_articles)')}
+    if not columns:
+        return
+    
+    if 'sentiment_label_id' not in columns:
+        conn.execute('ALTER TABLE news_articles ADD COLUMN sentiment_label_id INTEGER')
+        conn.execute('''
+            UPDATE news_articles
+            SET sentiment_label_id = CASE sentiment_label
+                WHEN 'positive' THEN 1
+                WHEN 'negative' THEN -1
+                ELSE 0
+            END
+            WHERE sentiment_label IS NOT NULL
+        ''')
+    
+    if 'text_norm' not in columns:
+        conn.execute('ALTER TABLE news_articles ADD COLUMN text_norm TEXT')
+        conn.create_function('normalize_news_text', 2, normalize_news_text, deterministic=True)
+        conn.execute('UPDATE news_articles SET text_norm = normalize_news_text(title, summary)')
+    
+    # 예전 title_hash 단독 UNIQUE 인덱스는 다른 종목의 같은 기사까지 막았으므로 지문을 다시 채움
+    legacy_title_index = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_news_title_hash'"
+    ).fetchone() is not None
+    
+    if 'title_hash' not in columns or legacy_title_index:
+        if 'title_hash' not in columns:
+            conn.execute('ALTER TABLE news_articles ADD COLUMN title_hash INTEGER')
+        conn.execute('DROP INDEX IF EXISTS idx_news_title_hash')
+        conn.create_function('news_title_hash', 3, news_title_hash, deterministic=True)
+        conn.execute('UPDATE news_articles SET title_hash = news_title_hash(title, source, published_date)')
+        # 이미 저장된 중복 기사는 UNIQUE 인덱스를 만들 수 있도록 종목별 첫 행 외에는 NULL 처리
+        conn.execute('''
+            UPDATE news_articles
+            SET title_hash = NULL
+            WHERE id NOT IN (SELECT MIN(id) FROM news_articles GROUP BY stock_code, title_hash)
+        ''')
+    
+    conn.commit()
+
+
+def _score_sentiment_tags_loop(tags, offsets):
+    """기사별 태그 구간(+1 긍정 / -1 부정)을 (긍정-부정)/(긍정+부정) 점수로 집계"""
+    scores = np.empty(len(offsets) - 1)
+    for i in range(len(offsets) - 1):
+        positive = 0
+        negative = 0
+        for j in range(offsets[i], offsets[i + 1]):
+            if tags[j] > 0:
+                positive += 1
+            else:
+                negative += 1
+        total = positive + negative
+        scores[i] = 0.0 if total == 0 else (positive - negative) / total
+    return scores
+
+
+if njit is not None:
+    score_sentiment_tags = njit(cache=True)(_score_sentiment_tags_loop)
+else:
+    def score_sentiment_tags(tags, offsets):
+        """기사별 태그 구간을 감정 점수로 집계 (NumPy 버전)"""
+        lengths = np.diff(offsets)
+        article_index = np.repeat(np.arange(len(lengths)), lengths)
+        balance = np.bincount(article_index, weights=tags, minlength=len(lengths))
+        return np.where(lengths > 0, balance / np.maximum(lengths, 1), 0.0)
+
+
 class NewsQualityValidator:
     """
     뉴스 품질 검증 시스템
@@ -72,7 +387,11 @@ class NewsQualityValidator:
     각 뉴스에 신뢰도 점수를 부여합니다.
     """
     
-    def __init__(self):
+    def __init__(self, db_path=None):
+        """
+        Args:
+            db_path: 내용 해시를 저장할 DB 경로 (지정하면 실행 간에도 중복 검출, None이면 메모리에만 보관)
+        """
         # 스팸 패턴 정의 (한국 주식 뉴스 특화)
         self.spam_patterns = [
             r'클릭.*조회',
@@ -90,6 +409,8 @@ class NewsQualityValidator:
             r'무료.*추천',
             r'VIP.*종목'
         ]
+        # 패턴별로 본문을 반복 탐색하지 않도록 하나의 정규식으로 결합
+        self.spam_regex = re.compile('|'.join(f'(?:{pattern})' for pattern in self.spam_patterns))
         
         # 신뢰할 수 있는 뉴스 소스 (네이버 금융 기준)
         self.trusted_sources = {
@@ -107,6 +428,7 @@ class NewsQualityValidator:
             'MBN': 72,
             'SBS Biz': 75
         }
+        self.trusted_source_regex = re.compile('|'.join(map(re.escape, self.trusted_sources)))
         
         # 의심스러운 키워드 (명백한 오류 포함)
         self.suspicious_keywords = [
@@ -118,19 +440,32 @@ class NewsQualityValidator:
             '888원', '777원', '666원',  # 의심스러운 패턴
             '○○○원', 'XXX원'  # 마스킹된 데이터
         ]
+        keywords = list(dict.fromkeys(keyword.lower() for keyword in self.suspicious_keywords))
+        self._keyword_automaton = self._build_keyword_automaton(keywords)
+        # pyahocorasick이 없을 때 사용할 결합 정규식
+        self.suspicious_keyword_regex = re.compile('|'.join(map(re.escape, keywords)))
         
         # 중복 검출용 캐시
+        # (제목: 최근 1000개, 내용 해시: 최근 5000개를 삽입 순서대로 유지)
         self.content_hashes = set()
-        self.title_cache = {}
+        self.content_hash_order = deque()
+        self.title_cache = OrderedDict()
+        # 여러 수집 스레드가 같은 검증기를 공유하므로 캐시 조회/갱신은 잠금 안에서 수행
+        self._cache_lock = threading.Lock()
+        
+        # 이전 실행에서 저장된 기사 본문 지문 (content_hashes 테이블, 검증 중에는 조회만 함)
+        # 기록은 save_news_to_db가 실제로 저장된 행에 대해 같은 트랜잭션에서 수행
+        self.db_path = db_path
         
         logger.info("✅ 뉴스 품질 검증 시스템 초기화 완료")
     
-    def validate_news(self, news_data: Dict) -> Tuple[bool, int, List[str]]:
+    def validate_news(self, news_data: Dict, stored_hashes: Optional[Set[int]] = None) -> Tuple[bool, int, List[str]]:
         """
         뉴스 품질 종합 검증
         
         Args:
             news_data: 뉴스 데이터 딕셔너리
+            stored_hashes: stored_content_hashes로 미리 조회한 저장된 본문 지문 (없으면 기사마다 조회)
             
         Returns:
             Tuple[is_valid, quality_score, issues]: 
@@ -151,7 +486,7 @@ class NewsQualityValidator:
             score -= 30
         
         # 2. 중복 검사 (25점 감점)
-        if self._is_duplicate_content(title, content):
+        if self._is_duplicate_content(title, content, stored_hashes):
             issues.append("중복 콘텐츠")
             score -= 25
         
@@ -192,69 +527,186 @@ class NewsQualityValidator:
         """스팸 패턴 검사"""
         text_combined = f"{title} {content}".lower()
         
-        for pattern in self.spam_patterns:
-            if re.search(pattern, text_combined):
-                return True
+        if self.spam_regex.search(text_combined):
+            return True
         
         # 과도한 특수문자 사용 (스팸 특징)
-        special_char_ratio = len(re.findall(r'[!@#$%^&*()+=\[\]{}|\\:";\'<>?,./]', text_combined)) / max(len(text_combined), 1)
+        special_char_ratio = len(SPAM_SPECIAL_CHAR_RE.findall(text_combined)) / max(len(text_combined), 1)
         if special_char_ratio > 0.1:  # 10% 이상
             return True
         
         # 과도한 숫자 사용
-        number_ratio = len(re.findall(r'\d', text_combined)) / max(len(text_combined), 1)
+        number_ratio = len(DIGIT_RE.findall(text_combined)) / max(len(text_combined), 1)
         if number_ratio > 0.3:  # 30% 이상
             return True
         
         return False
     
-    def _is_duplicate_content(self, title: str, content: str) -> bool:
-        """중복 콘텐츠 검사"""
-        # 제목 기반 유사도 검사
+    def prevalidate_title(self, title: str) -> Tuple[bool, int, List[str]]:
+        """
+        제목만으로 가능한 사전 검사 (본문 요청 전)
+        
+        스팸·중복·의심 키워드 감점은 제목에서 발견되면 본문과 관계없이 그대로 적용되므로,
+        이 감점만으로 70점 미만이 되면 본문을 받아도 validate_news를 통과할 수 없습니다.
+        
+        Returns:
+            Tuple[may_pass, quality_score, issues]: 본문 검사 필요 여부, 제목 기준 점수 상한, 문제점
+        """
+        issues = []
+        score = 100
         title_normalized = self._normalize_text(title)
         
+        if self.spam_regex.search(title.lower()):
+            issues.append("스팸 패턴 감지")
+            score -= 30
+        
+        with self._cache_lock:
+            is_similar = self._is_similar_title(title_normalized)
+        if is_similar:
+            issues.append("중복 콘텐츠")
+            score -= 25
+        
+        if self._has_suspicious_keywords(title, ''):
+            issues.append("의심스러운 키워드 포함")
+            score -= 20
+        
+        may_pass = score >= 70
+        if not may_pass and not is_similar:
+            # validate_news를 거쳤을 때처럼 이후 기사와의 제목 비교 대상에 포함
+            with self._cache_lock:
+                self._remember_title(title_normalized)
+        
+        return may_pass, score, issues
+    
+    def _is_similar_title(self, title_normalized: str) -> bool:
+        """캐시된 제목 중 85% 초과 유사한 제목이 있는지 검사 (캐시는 변경하지 않음, _cache_lock 안에서 호출)"""
+        if fuzz is not None:
+            # C++ 구현으로 캐시 전체를 한 번에 비교
+            best = fuzz_process.extractOne(title_normalized, self.title_cache.keys(),
+                                           scorer=fuzz.ratio, score_cutoff=85)
+            return best is not None and best[1] > 85
+        
+        # real_quick_ratio(길이)·quick_ratio(문자 빈도)는 ratio()의 상한이므로
+        # 값싼 상한 검사에서 걸러진 제목은 비싼 ratio() 계산을 생략 (판정 결과는 동일)
+        matcher = difflib.SequenceMatcher(None, title_normalized)
         for cached_title in self.title_cache.keys():
-            similarity = difflib.SequenceMatcher(None, title_normalized, cached_title).ratio()
-            if similarity > 0.85:  # 85% 이상 유사하면 중복
+            matcher.set_seq2(cached_title)
+            if (matcher.real_quick_ratio() > 0.85 and matcher.quick_ratio() > 0.85
+                    and matcher.ratio() > 0.85):  # 85% 이상 유사하면 중복
                 return True
         
-        # 캐시에 추가 (최대 1000개까지만 유지)
+        return False
+    
+    def _remember_title(self, title_normalized: str):
+        """제목 캐시에 추가 (최대 1000개까지만 유지, 가장 오래된 항목부터 삭제, _cache_lock 안에서 호출)"""
+        self.title_cache[title_normalized] = True
         if len(self.title_cache) > 1000:
-            # 오래된 항목 절반 삭제
-            items = list(self.title_cache.items())
-            self.title_cache = dict(items[500:])
+            self.title_cache.popitem(last=False)
+    
+    def _is_duplicate_content(self, title: str, content: str, stored_hashes: Optional[Set[int]] = None) -> bool:
+        """중복 콘텐츠 검사"""
+        # 제목 기반 유사도 검사
+        title_normalized = self._normalize_text(title)
+        with self._cache_lock:
+            if self._is_similar_title(title_normalized):
+                return True
+            self._remember_title(title_normalized)
+        
+        # 내용 해시 기반 중복 검사 (이전 실행에서 저장된 본문 → 이번 실행에서 검증한 본문)
+        normalized_content = self._normalize_text(content)
+        content_hash = content_fingerprint(normalized_content)
+        if normalized_content:
+            if stored_hashes is None:
+                stored_hashes = self.stored_content_hashes([content])
+            if content_hash in stored_hashes:
+                return True
         
-        self.title_cache[title_normalized] = True
+        with self._cache_lock:
+            if content_hash in self.content_hashes:
+                return True
+            
+            self.content_hashes.add(content_hash)
+            self.content_hash_order.append(content_hash)
+            
+            # 메모리 관리 (가장 오래된 해시부터 삭제)
+            if len(self.content_hash_order) > 5000:
+                self.content_hashes.discard(self.content_hash_order.popleft())
         
-        # 내용 해시 기반 중복 검사
-        content_hash = hash(self._normalize_text(content))
-        if content_hash in self.content_hashes:
-            return True
+        return False
+    
+    def _content_hash(self, content: Optional[str]) -> Optional[int]:
+        """정규화한 본문 지문 (본문이 비어 있으면 None)"""
+        normalized_content = self._normalize_text(content or '')
+        return content_fingerprint(normalized_content) if normalized_content else None
+    
+    def stored_content_hashes(self, contents) -> Set[int]:
+        """
+        본문들 중 이미 저장된 기사의 본문 지문 집합 조회
         
-        self.content_hashes.add(content_hash)
+        스레드별 읽기 전용 연결로 한 번에 조회하며 기록하지 않습니다.
+        비동기 수집은 종목 단위로 이 조회만 스레드에서 실행하고 검증은 이벤트 루프에서 수행합니다.
+        """
+        hashes = list({h for h in map(self._content_hash, contents) if h is not None})
+        if self.db_path is None or not hashes:
+            return set()
         
-        # 메모리 관리
-        if len(self.content_hashes) > 5000:
-            # 절반 삭제
-            self.content_hashes = set(list(self.content_hashes)[2500:])
+        stored = set()
+        try:
+            conn = get_read_connection(self.db_path)
+            # SQLite 바인딩 변수 개수 제한을 고려해 나눠서 조회
+            for i in range(0, len(hashes), 500):
+                chunk = hashes[i:i + 500]
+                placeholders = ','.join('?' * len(chunk))
+                rows = conn.execute(f'SELECT hash FROM content_hashes WHERE hash IN ({placeholders})', chunk)
+                stored.update(row[0] for row in rows)
+        except sqlite3.Error as e:
+            logger.debug(f"본문 지문 조회 실패: {e}")
+        
+        return stored
+    
+    def record_content_hashes(self, cursor, contents) -> None:
+        """
+        저장된 기사 본문 지문을 content_hashes에 기록
         
-        return False
+        호출한 쪽 트랜잭션 안에서 실행되므로 기사 저장과 함께 커밋/롤백됩니다.
+        본문이 비어 있는 기사(본문 요청 실패 등)는 기록하지 않습니다.
+        """
+        hashes = [(h,) for h in map(self._content_hash, contents) if h is not None]
+        if hashes:
+            cursor.executemany('INSERT OR IGNORE INTO content_hashes (hash) VALUES (?)', hashes)
     
     def _has_suspicious_keywords(self, title: str, content: str) -> bool:
         """의심스러운 키워드 검사"""
         text_combined = f"{title} {content}".lower()
         
-        for keyword in self.suspicious_keywords:
-            if keyword.lower() in text_combined:
-                return True
+        if self._keyword_automaton is not None:
+            return next(self._keyword_automaton.iter(text_combined), None) is not None
         
-        return False
+        return self.suspicious_keyword_regex.search(text_combined) is not None
+    
+    @staticmethod
+    def _build_keyword_automaton(keywords):
+        """의심 키워드 Aho-Corasick 오토마톤 (키워드 수와 관계없이 본문을 한 번만 탐색)"""
+        if ahocorasick is None:
+            return None
+        
+        automaton = ahocorasick.Automaton()
+        for keyword in keywords:
+            automaton.add_word(keyword, keyword)
+        automaton.make_automaton()
+        
+        return automaton
     
     def _get_source_credibility(self, source: str) -> int:
         """소스 신뢰도 점수 반환"""
-        for trusted_source, score in self.trusted_sources.items():
-            if trusted_source in source:
-                return score
+        # 대부분 출처명이 그대로 들어오므로 딕셔너리 조회 후, 부분 일치는 결합 정규식 한 번으로 검사
+        score = self.trusted_sources.get(source)
+        if score is not None:
+            return score
+        
+        match = self.trusted_source_regex.search(source)
+        if match:
+            return self.trusted_sources[match.group()]
         
         # 네이버금융 출처는 중간 점수
         if '네이버금융' in source:
@@ -277,19 +729,18 @@ class NewsQualityValidator:
         elif len(content) > 10000:
             quality_score -= 5
         
-        # 문장 구조 검사
-        sentences = re.split(r'[.!?]', content)
-        if len(sentences) < 2:
+        # 문장 구조 검사 (문장 부호가 하나도 없으면 한 문장, 문장 목록은 만들지 않음)
+        if SENTENCE_END_RE.search(content) is None:
             quality_score -= 20
         
         # 의미 있는 단어 비율
-        words = re.findall(r'[가-힣]+', content)
+        words = HANGUL_WORD_RE.findall(content)
         if len(words) < 10:
             quality_score -= 25
         
         # 반복 구문 검사
-        word_freq = Counter(words)
-        if word_freq.most_common(1) and word_freq.most_common(1)[0][1] > len(words) * 0.1:
+        max_freq = max(Counter(words).values(), default=0)
+        if max_freq > len(words) * 0.1:
             quality_score -= 15
         
         return max(0, quality_score)
@@ -298,37 +749,78 @@ class NewsQualityValidator:
         """인코딩 오류 검사"""
         text_combined = f"{title} {content}"
         
-        # 깨진 문자 패턴
-        broken_patterns = [
-            r'[^\w\s가-힣ㄱ-ㅎㅏ-ㅣ.,!?()[\]{}:;"\'-]',  # 비정상 문자
-            r'(?:[��]{2,})',  # 연속된 깨진 문자
-            r'(?:&[a-zA-Z]+;){3,}',  # 과도한 HTML 엔티티
-            r'[?]{3,}',  # 연속된 물음표 (깨진 문자)
-        ]
-        
-        for pattern in broken_patterns:
-            if re.search(pattern, text_combined):
-                return True
-        
-        return False
+        return BROKEN_TEXT_RE.search(text_combined) is not None
     
     def _normalize_text(self, text: str) -> str:
         """텍스트 정규화"""
         if not text:
             return ""
         
-        # 유니코드 정규화
-        text = unicodedata.normalize('NFKC', text)
+        # 유니코드 정규화 (ASCII 문자열은 NFKC 결과가 같으므로 생략)
+        if not text.isascii():
+            text = unicodedata.normalize('NFKC', text)
         
         # 공백 정리
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = ' '.join(text.split())
         
         # 특수문자 제거 (비교용)
-        text = re.sub(r'[^\w\s가-힣]', '', text)
+        text = NON_WORD_RE.sub('', text)
         
         return text.lower()
 
 
+class TokenBucket:
+    """
+    스레드 안전 토큰 버킷 요청 속도 제한기
+    
+    초당 rate개의 토큰을 채우고 요청 전 acquire()로 토큰을 하나씩 소비합니다.
+    여러 스레드가 같은 버킷을 공유하면 전체 요청 속도가 rate 이하로 유지됩니다.
+    """
+    
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity or rate
+        self.tokens = self.capacity
+        self.last_refill = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def acquire(self):
+        """토큰 하나를 얻을 때까지 대기 (대기는 락 밖에서 수행)"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+                self.last_refill = now
+                
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                
+                wait_time = (1 - self.tokens) / self.rate
+            
+            time.sleep(wait_time)
+    
+    def reserve(self) -> float:
+        """
+        토큰 하나를 바로 예약하고 사용 가능 시점까지 남은 대기 시간(초) 반환
+        
+        토큰이 모자라면 잔량을 음수로 남겨 다음 예약자가 그만큼 더 기다리므로,
+        동시에 예약해도 요청 시점이 1/rate초 간격으로 나뉩니다.
+        """
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+            self.last_refill = now
+            self.tokens -= 1
+            return max(0.0, -self.tokens / self.rate)
+    
+    async def acquire_async(self):
+        """⚡ 이벤트 루프를 막지 않고 토큰 하나를 얻을 때까지 대기"""
+        wait_time = self.reserve()
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
+
+
 class EnhancedNewsCollector:
     """
     강화된 뉴스 수집기 (품질 검증 통합)
@@ -336,12 +828,87 @@ class EnhancedNewsCollector:
     주식 관련 뉴스를 다양한 소스에서 수집하고 저장합니다.
     """
     
-    def __init__(self):
+    NEWS_LIST_URL = "https://finance.naver.com/item/news_news.naver"
+    
+    # news_articles 보조 인덱스 (대량 적재 시 제거 후 재생성)
+    NEWS_INDEXES = {
+        'idx_news_stock_code': 'CREATE INDEX IF NOT EXISTS idx_news_stock_code ON news_articles(stock_code)',
+        'idx_news_published_date': 'CREATE INDEX IF NOT EXISTS idx_news_published_date ON news_articles(published_date)',
+        'idx_news_quality_score': 'CREATE INDEX IF NOT EXISTS idx_news_quality_score ON news_articles(quality_score)',
+        'idx_news_is_verified': 'CREATE INDEX IF NOT EXISTS idx_news_is_verified ON news_articles(is_verified)',
+        'idx_news_collected_date': 'CREATE INDEX IF NOT EXISTS idx_news_collected_date ON news_articles(collected_date)',
+        # 일별 감정 지수 집계용 커버링 인덱스 (본문이 든 테이블 행을 읽지 않고 집계)
+        'idx_news_daily_sentiment': 'CREATE INDEX IF NOT EXISTS idx_news_daily_sentiment '
+                                    'ON news_articles(stock_code, published_date, sentiment_label_id, '
+                                    'sentiment_score, quality_score, is_verified)',
+        # 감정 분포 요약용 커버링 인덱스 (검증 여부 → 라벨 순으로 바로 그룹핑)
+        'idx_news_verified_label': 'CREATE INDEX IF NOT EXISTS idx_news_verified_label '
+                                   'ON news_articles(is_verified, sentiment_label, quality_score)',
+        # 감정 분석 대기 뉴스 전용 부분 인덱스 (분석이 끝난 행은 인덱스에서 빠짐)
+        'idx_news_unanalyzed': 'CREATE INDEX IF NOT EXISTS idx_news_unanalyzed '
+                               'ON news_articles(quality_score DESC, id) '
+                               'WHERE sentiment_score IS NULL AND is_verified = 1',
+    }
+    
+    # 종목당 예상 수집 건수 (페이지당 약 10건 x 5페이지)
+    EXPECTED_NEWS_PER_STOCK = 50
+    
+    # 전체 수집 시 이 건수만큼 모아서 한 트랜잭션으로 저장
+    NEWS_BATCH_SIZE = 10_000
+    
+    # 저장 스레드 대기 배치 수 (저장이 밀리면 수집 쪽이 기다리도록 제한)
+    WRITE_QUEUE_SIZE = 2
+    
+    # 진행률 표시줄 postfix 갱신 최소 간격 (초, tqdm mininterval과 동일)
+    POSTFIX_INTERVAL = 0.5
+    
+    # 다양한 뉴스 사이트의 본문 선택자 (우선순위 순)
+    CONTENT_SELECTORS = (
+        '.news_body',
+        '.article_body', 
+        '.news_content',
+        '#news_body',
+        '.news_text',
+        '.article_content',
+        '#articleBodyContents',
+        '.newsct_article',
+        '.article-view-content',
+        '.news-article-content'
+    )
+    
+    # lxml 경로용 본문 XPath (CONTENT_SELECTORS와 같은 순서)
+    CONTENT_XPATHS = tuple(
+        etree.XPath(f"//*[@id='{selector[1:]}']" if selector.startswith('#')
+                    else f"//*[{_HAS_CLASS.format(selector[1:])}]")
+        for selector in CONTENT_SELECTORS
+    ) if lxml_html is not None else ()
+    
+    # 파싱 범위 제한: 본문 후보 요소만 트리로 구성 (클래스 기준 → id 기준)
+    CONTENT_STRAINERS = (
+        SoupStrainer(class_=re.compile(r'(?:^|\s)(?:news_body|article_body|news_content|news_text|article_content|'
+                                       r'newsct_article|article-view-content|news-article-content)(?:\s|$)')),
+        SoupStrainer(id=['news_body', 'articleBodyContents']),
+    )
+    # 다중 클래스 요소(class="type5 tb_cont")도 잡도록 정규식으로 매칭
+    LIST_STRAINER = SoupStrainer(class_=re.compile(r'(?:^|\s)tb_cont(?:\s|$)'))
+    
+    # BeautifulSoup 대체 경로의 본문 내 제거 대상 (CSS 선택자 한 번으로 조회, 광고 클래스는 AD_CLASS_RE와 같은 조건)
+    UNWANTED_SELECTOR = 'script, style, iframe, ins, aside, nav, footer'
+    AD_CLASS_SELECTOR = '[class*="ad"], [class*="related"], [class*="recommend"], [class*="banner"]'
+    
+    # (연결, 읽기) 타임아웃: 응답 없는 호스트는 연결 단계에서 빨리 포기
+    LIST_TIMEOUT = (3.05, 10)
+    CONTENT_TIMEOUT = (3.05, 15)
+    
+    # 본문 페이지 최대 읽기 크기 (gzip 해제 후 기준)
+    MAX_CONTENT_BYTES = 512 * 1024
+    
+    def __init__(self, max_workers=3):
         self.data_dir = Path(DATA_DIR)
         self.db_path = self.data_dir / 'news_data.db'
         
         # 품질 검증 시스템 통합
-        self.quality_validator = NewsQualityValidator()
+        self.quality_validator = NewsQualityValidator(self.db_path)
         
         # 수집 통계
         self.stats = {
@@ -354,6 +921,22 @@ class EnhancedNewsCollector:
             'spam_filtered': 0,
             'low_quality_filtered': 0
         }
+        self._stats_lock = threading.Lock()
+        
+        # 이번 실행에서 이미 본문을 요청한 URL (여러 종목에 걸린 공통 기사 재요청 방지)
+        self.seen_urls = set()
+        self._seen_lock = threading.Lock()
+        
+        # 품질 필터링 로그 버퍼 (기사마다 연결/커밋하지 않고 종목 단위로 한 번에 저장)
+        self._filter_log_buffer = []
+        self._filter_log_lock = threading.Lock()
+        
+        # 조회 결과 캐시 (종목 리스트는 실행 중 고정, 요약은 DB 변경 시 무효화)
+        self._stock_list_cache = None
+        self._summary_cache = None
+        
+        # 진행률 postfix 마지막 갱신 시각 (종목마다 문자열을 만들지 않도록 주기 제한)
+        self._last_postfix_time = 0.0
         
         # HTTP 세션 설정
         self.session = requests.Session()
@@ -361,19 +944,60 @@ class EnhancedNewsCollector:
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'ko-KR,ko;q=0.8,en-US;q=0.5,en;q=0.3',
-            'Accept-Encoding': 'gzip, deflate, br',
+            # 설치된 디코더 기준으로 압축 방식 광고 (brotli 미설치 시 br 응답을 받지 않도록)
+            'Accept-Encoding': make_headers(accept_encoding=True)['accept-encoding'],
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
         })
         
+        # 연결 풀/요청 속도 제한을 워커 수 기준으로 설정
+        self.max_workers = None
+        self._configure_workers(max_workers)
+        
         self.init_database()
         print("✅ 강화된 뉴스 수집기 초기화 완료")
     
+    def _configure_workers(self, max_workers):
+        """워커 수에 맞춰 HTTP 연결 풀과 요청 속도 제한 재설정 (같은 워커 수면 그대로 유지)"""
+        if max_workers == self.max_workers:
+            return
+        
+        # 스레드 간 keep-alive 연결 재사용 (기본 풀 크기 10 → 워커 수 기준으로 확대)
+        adapter = HTTPAdapter(
+            pool_connections=max_workers,
+            pool_maxsize=max_workers * 4,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+        )
+        old_adapter = self.session.adapters['https://'] if self.max_workers is not None else None
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        if old_adapter is not None:
+            old_adapter.close()
+        
+        # 전체 스레드가 공유하는 요청 속도 제한 (초당 max_workers * 2건)
+        self.rate_limiter = TokenBucket(rate=max_workers * 2)
+        self.max_workers = max_workers
+    
+    def _connect(self):
+        """뉴스 DB 연결 (성능 PRAGMA 적용)"""
+        return connect_news_db(self.db_path)
+    
+    def _read_conn(self):
+        """조회 전용 연결 (스레드별 캐시)"""
+        return get_read_connection(self.db_path)
+    
     def init_database(self):
         """🗄️ 뉴스 데이터베이스 초기화 (품질 관련 컬럼 추가)"""
         print("🗄️ 뉴스 데이터베이스 초기화 중...")
         
-        with sqlite3.connect(self.db_path) as conn:
+        self._create_tables()
+        self._create_indexes()
+        
+        print("✅ 강화된 뉴스 데이터베이스 초기화 완료")
+    
+    def _create_tables(self):
+        """🗄️ 뉴스 관련 테이블 생성"""
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             # 강화된 뉴스 기사 테이블
@@ -392,6 +1016,9 @@ class EnhancedNewsCollector:
                     collected_date TEXT,
                     sentiment_score REAL,
                     sentiment_label TEXT,
+                    sentiment_label_id INTEGER,
+                    text_norm TEXT,
+                    title_hash INTEGER,
                     keywords TEXT,
                     view_count INTEGER,
                     comment_count INTEGER,
@@ -402,6 +1029,8 @@ class EnhancedNewsCollector:
                 )
             ''')
             
+            migrate_news_schema(conn)
+            
             # 감정 분석 결과 테이블
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS sentiment_analysis (
@@ -435,6 +1064,13 @@ class EnhancedNewsCollector:
                 )
             ''')
             
+            # 저장된 기사 본문 지문 (실행 간 중복 본문 판정용)
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS content_hashes (
+                    hash INTEGER PRIMARY KEY
+                )
+            ''')
+            
             # 품질 필터링 로그 테이블 (새로 추가)
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS quality_filter_log (
@@ -448,19 +1084,55 @@ class EnhancedNewsCollector:
                 )
             ''')
             
-            # 인덱스 생성
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_news_stock_code ON news_articles(stock_code)')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_news_published_date ON news_articles(published_date)')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_news_quality_score ON news_articles(quality_score)')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_news_is_verified ON news_articles(is_verified)')
+            conn.commit()
+    
+    def _create_indexes(self, analyze=False):
+        """🗂️ 인덱스 생성 (대량 적재 후 재생성 시 ANALYZE로 통계 갱신)"""
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            
+            existing = {row[0] for row in cursor.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+            
+            for ddl in self.NEWS_INDEXES.values():
+                cursor.execute(ddl)
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_sentiment_stock_date ON sentiment_analysis(stock_code, date)')
+            # 종목별 제목 중복 제거용 UNIQUE 인덱스 (INSERT OR IGNORE가 사용하므로 대량 적재 중에도 유지)
+            cursor.execute('CREATE UNIQUE INDEX IF NOT EXISTS idx_news_stock_title_hash '
+                           'ON news_articles(stock_code, title_hash)')
+            # 최근 필터링 통계용 커버링 인덱스 (기간 범위 검색 후 사유별 집계)
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_filter_log_date '
+                           'ON quality_filter_log(filtered_date, filter_reason, quality_score)')
+            
+            # 새로 만든 인덱스가 있으면 플래너가 바로 쓰도록 통계 갱신
+            if not analyze and not existing.issuperset(self.NEWS_INDEXES):
+                cursor.execute('ANALYZE news_articles')
             
+            if analyze:
+                cursor.execute('ANALYZE')
+            
+            conn.commit()
+    
+    def _drop_news_indexes(self):
+        """🗂️ 대량 적재 전 news_articles 보조 인덱스 제거"""
+        with self._connect() as conn:
+            for index_name in self.NEWS_INDEXES:
+                conn.execute(f'DROP INDEX IF EXISTS {index_name}')
             conn.commit()
+    
+    def _is_bulk_load(self, stock_count):
+        """대량 적재 여부 판단 (예상 신규 건수가 기존 건수보다 많으면 대량 적재)"""
+        try:
+            existing = self._read_conn().execute('SELECT COUNT(*) FROM news_articles').fetchone()[0]
+        except Exception:
+            return False
         
-        print("✅ 강화된 뉴스 데이터베이스 초기화 완료")
+        return stock_count * self.EXPECTED_NEWS_PER_STOCK > existing
     
     def get_stock_list_from_db(self):
         """📊 주식 DB에서 종목 리스트 가져오기"""
+        if self._stock_list_cache is not None:
+            return list(self._stock_list_cache)
+        
         stock_db_path = self.data_dir / 'stock_data.db'
         
         if not stock_db_path.exists():
@@ -468,22 +1140,25 @@ class EnhancedNewsCollector:
             return []
         
         try:
-            with sqlite3.connect(stock_db_path) as conn:
-                query = """
-                    SELECT DISTINCT symbol as stock_code, name as stock_name
-                    FROM stock_info
-                    WHERE symbol IS NOT NULL 
-                    AND LENGTH(symbol) = 6
-                    ORDER BY symbol
-                """
-                result = pd.read_sql_query(query, conn)
-                return result.to_dict('records')
+            # 조회만 하므로 캐시된 읽기 전용 연결 사용 (성능 PRAGMA 적용)
+            conn = get_read_connection(stock_db_path)
+            query = """
+                SELECT DISTINCT symbol as stock_code, name as stock_name
+                FROM stock_info
+                WHERE symbol IS NOT NULL 
+                AND LENGTH(symbol) = 6
+                ORDER BY symbol
+            """
+            cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
+            self._stock_list_cache = [dict(row) for row in cursor.execute(query)]
+            return list(self._stock_list_cache)
                 
         except Exception as e:
             print(f"❌ 주식 DB 조회 실패: {e}")
             return []
     
-    def collect_naver_finance_news(self, stock_code, stock_name, days=7, max_pages=5):
+    def collect_naver_finance_news(self, stock_code, stock_name, days=7, max_pages=5, flush_log=True):
         """
         📰 네이버 금융 뉴스 수집 (품질 검증 통합)
         
@@ -492,16 +1167,17 @@ class EnhancedNewsCollector:
             stock_name (str): 종목명
             days (int): 수집할 일수
             max_pages (int): 최대 페이지 수
+            flush_log (bool): 필터링 로그를 바로 저장할지 여부 (전체 수집 시 저장 스레드가 담당)
             
         Returns:
             list: 수집된 고품질 뉴스 리스트
         """
         news_list = []
+        cutoff = self._published_cutoff(days)
         
         try:
-            # 네이버 금융 종목 뉴스 URL
-            base_url = f"https://finance.naver.com/item/news_news.naver"
-            
+            # 1단계: 목록 페이지에서 후보 뉴스 수집 (최신순 목록이므로 기간 밖 뉴스가 나오면 이후 페이지 생략)
+            items = []
             for page in range(1, max_pages + 1):
                 params = {
                     'code': stock_code,
@@ -509,206 +1185,497 @@ class EnhancedNewsCollector:
                 }
                 
                 try:
-                    response = self.session.get(base_url, params=params, timeout=10)
+                    self.rate_limiter.acquire()
+                    response = self.session.get(self.NEWS_LIST_URL, params=params, timeout=self.LIST_TIMEOUT)
                     response.raise_for_status()
                     
-                    # 인코딩 자동 감지
-                    response.encoding = response.apparent_encoding
-                    
-                    soup = BeautifulSoup(response.text, 'html.parser')
+                    # 헤더 charset이 있으면 그대로 디코딩, 없으면 bytes를 파서에 넘겨 meta charset으로 판별
+                    # (apparent_encoding의 본문 전체 문자셋 추정 생략)
+                    if 'charset=' in response.headers.get('Content-Type', '').lower():
+                        html = response.text
+                    else:
+                        html = response.content
                     
-                    # 뉴스 목록 파싱
-                    news_items = soup.select('.tb_cont tr')
+                    page_items = self._parse_news_list(html)
+                    recent_items = [item for item in page_items if item['published_date'] >= cutoff]
+                    items.extend(recent_items)
+                    if len(recent_items) < len(page_items):
+                        break
                     
-                    for item in news_items:
-                        try:
-                            # 제목과 링크 추출
-                            title_elem = item.select_one('.title a')
-                            if not title_elem:
-                                continue
-                            
-                            title = title_elem.get_text(strip=True)
-                            news_url = urljoin("https://finance.naver.com", title_elem.get('href'))
-                            
-                            # 날짜 추출
-                            date_elem = item.select_one('.date')
-                            if date_elem:
-                                date_str = date_elem.get_text(strip=True)
-                                published_date = self.parse_date(date_str)
-                            else:
-                                published_date = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                            
-                            # 정보 제공자 추출
-                            info_elem = item.select_one('.info')
-                            source = info_elem.get_text(strip=True) if info_elem else '네이버금융'
-                            
-                            # 뉴스 상세 내용 수집 (강화된 추출)
-                            content, summary = self.get_enhanced_news_content(news_url)
-                            
-                            news_data = {
-                                'stock_code': stock_code,
-                                'stock_name': stock_name,
-                                'title': title,
-                                'content': content,
-                                'summary': summary,
-                                'url': news_url,
-                                'source': f'네이버금융-{source}',
-                                'published_date': published_date,
-                                'collected_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                            }
-                            
-                            # 🆕 품질 검증
-                            is_valid, quality_score, issues = self.quality_validator.validate_news(news_data)
-                            
-                            if is_valid:
-                                # 품질 정보 추가
-                                news_data['quality_score'] = quality_score
-                                news_data['quality_issues'] = ', '.join(issues) if issues else ''
-                                news_data['is_verified'] = True
-                                news_data['credibility_rating'] = self._get_credibility_rating(quality_score)
-                                
-                                news_list.append(news_data)
-                                self.stats['quality_passed'] += 1
-                            else:
-                                # 필터링된 뉴스 로그 저장
-                                self._log_filtered_news(stock_code, title, news_url, issues, quality_score)
-                                self.stats['quality_failed'] += 1
-                                
-                                if '스팸 패턴 감지' in issues:
-                                    self.stats['spam_filtered'] += 1
-                                if '콘텐츠 품질 부족' in issues:
-                                    self.stats['low_quality_filtered'] += 1
-                            
-                            # 요청 간격 조절
-                            time.sleep(random.uniform(0.5, 1.5))
-                            
-                        except Exception as e:
-                            print(f"  ⚠️ 뉴스 항목 파싱 실패: {e}")
-                            continue
+                except Exception as e:
+                    print(f"  ❌ 페이지 {page} 수집 실패: {e}")
+                    continue
+            
+            # 2단계: 이미 저장된 뉴스와 제목만으로 탈락이 확정된 뉴스를 제외하고 본문 수집
+            for item in self._select_fetch_candidates(stock_code, items):
+                try:
+                    # 뉴스 상세 내용 수집 (강화된 추출)
+                    content, summary = self.get_enhanced_news_content(item['url'])
                     
-                    # 페이지 간 간격
-                    time.sleep(random.uniform(1, 2))
+                    news_data = self._build_verified_news(stock_code, stock_name, item, content, summary)
+                    if news_data:
+                        news_list.append(news_data)
                     
                 except Exception as e:
-                    print(f"  ❌ 페이지 {page} 수집 실패: {e}")
+                    print(f"  ⚠️ 뉴스 항목 처리 실패: {e}")
                     continue
             
         except Exception as e:
             print(f"❌ {stock_code}({stock_name}) 뉴스 수집 실패: {e}")
         
+        # 종목 단위로 필터링 로그 일괄 저장
+        if flush_log:
+            self._flush_filter_log()
+        
         return news_list
     
-    def get_enhanced_news_content(self, url):
+    @staticmethod
+    def _client_timeout(timeout):
         """
-        📄 강화된 뉴스 상세 내용 추출
+        (연결, 읽기) 타임아웃을 aiohttp 타임아웃으로 변환
+        
+        total은 연결 풀의 빈 연결을 기다리는 시간까지 포함하므로 쓰지 않음
+        (같은 호스트 요청이 limit_per_host에 막혀 대기하는 동안 타임아웃되지 않도록)
+        """
+        connect_timeout, read_timeout = timeout
+        return aiohttp.ClientTimeout(total=None, sock_connect=connect_timeout, sock_read=read_timeout)
+    
+    async def _fetch(self, session, url, params=None):
+        """🌐 비동기 HTTP GET (실패 시 None 반환, 헤더 charset이 없으면 bytes 반환)"""
+        try:
+            # 스레드 경로와 같은 토큰 버킷으로 요청 속도 제한
+            await self.rate_limiter.acquire_async()
+            async with session.get(url, params=params,
+                                   timeout=self._client_timeout(self.LIST_TIMEOUT)) as response:
+                response.raise_for_status()
+                if response.charset is None:
+                    # 문자셋 추정 대신 파서가 meta charset으로 디코딩
+                    return await response.read()
+                return await response.text(errors='replace')
+        except Exception as e:
+            logger.debug(f"비동기 요청 실패 - {url}: {e}")
+            return None
+    
+    async def _fetch_limited(self, session, url, max_bytes):
+        """🌐 비동기 HTTP GET, 본문을 최대 max_bytes까지만 읽어 bytes로 반환 (실패 시 None)"""
+        try:
+            await self.rate_limiter.acquire_async()
+            async with session.get(url, timeout=self._client_timeout(self.CONTENT_TIMEOUT)) as response:
+                response.raise_for_status()
+                
+                body = bytearray()
+                async for chunk in response.content.iter_chunked(64 * 1024):
+                    body.extend(chunk)
+                    if len(body) >= max_bytes:
+                        break
+                
+                return bytes(body[:max_bytes])
+        except Exception as e:
+            logger.debug(f"비동기 요청 실패 - {url}: {e}")
+            return None
+    
+    async def collect_naver_finance_news_async(self, session, stock_code, stock_name, days=7, max_pages=5,
+                                               flush_log=True):
+        """
+        ⚡ 네이버 금융 뉴스 비동기 수집 (목록/본문 요청을 동시에 처리)
         
         Args:
-            url (str): 뉴스 URL
+            session (aiohttp.ClientSession): 공유 HTTP 세션
+            stock_code (str): 종목코드
+            stock_name (str): 종목명
+            days (int): 수집할 일수
+            max_pages (int): 최대 페이지 수
+            flush_log (bool): 필터링 로그를 바로 저장할지 여부 (전체 수집 시 저장 스레드가 담당)
             
         Returns:
-            tuple: (content, summary)
+            list: 수집된 고품질 뉴스 리스트
         """
+        news_list = []
+        cutoff = self._published_cutoff(days)
+        
         try:
-            response = self.session.get(url, timeout=15)
-            response.raise_for_status()
-            
-            # 인코딩 자동 감지 및 설정
-            response.encoding = response.apparent_encoding
+            # 목록 페이지 동시 요청
+            pages = await asyncio.gather(*[
+                self._fetch(session, self.NEWS_LIST_URL, {'code': stock_code, 'page': page})
+                for page in range(1, max_pages + 1)
+            ])
             
-            soup = BeautifulSoup(response.text, 'html.parser', from_encoding='utf-8')
+            # HTML 파싱/DB 조회는 CPU·블로킹 작업이므로 스레드에서 실행해 이벤트 루프를 막지 않음
+            items = []
+            for page, html in enumerate(pages, 1):
+                if html is None:
+                    print(f"  ❌ 페이지 {page} 수집 실패")
+                    continue
+                page_items = await asyncio.to_thread(self._parse_news_list, html)
+                items.extend(item for item in page_items if item['published_date'] >= cutoff)
             
-            # 다양한 뉴스 사이트의 본문 선택자 (확장)
-            content_selectors = [
-                '.news_body',
-                '.article_body', 
-                '.news_content',
-                '#news_body',
-                '.news_text',
-                '.article_content',
-                '#articleBodyContents',
-                '.newsct_article',
-                '.article-view-content',
-                '.news-article-content'
-            ]
+            # 본문 페이지 동시 요청 (요청 간격은 _fetch_limited의 토큰 버킷이 조절)
+            async def fetch_content(url):
+                html = await self._fetch_limited(session, url, self.MAX_CONTENT_BYTES)
+                if html is None:
+                    return None  # 요청 실패
+                if not html:
+                    return "", ""
+                return await asyncio.to_thread(self._parse_news_content, html)
             
-            content = ""
-            for selector in content_selectors:
-                content_elem = soup.select_one(selector)
-                if content_elem:
-                    # 광고, 관련기사 등 제거 (강화)
-                    for unwanted in content_elem.find_all(['script', 'style', 'iframe', 'ins', 'aside', 'nav', 'footer']):
-                        unwanted.decompose()
-                    
-                    # 광고 관련 클래스 제거
-                    for elem in content_elem.find_all(class_=re.compile(r'(ad|advertisement|related|recommend|banner)')):
-                        elem.decompose()
-                    
-                    content = content_elem.get_text(separator=' ', strip=True)
-                    break
+            # 이미 저장된 뉴스와 제목만으로 탈락이 확정된 뉴스는 본문 요청 생략
+            # (DB 조회만 스레드에서 실행, 제목 사전 검사는 검증기 캐시를 쓰므로 이벤트 루프에서 실행)
+            items = await asyncio.to_thread(self._filter_new_items, items)
+            items = self._prevalidate_items(stock_code, items)
+            contents = await asyncio.gather(*[fetch_content(item['url']) for item in items])
             
-            # 강화된 텍스트 정제
-            content = self._advanced_text_cleaning(content)
+            # 본문 요청에 실패한 뉴스는 검증/저장하지 않고 다른 종목 목록에서 다시 요청할 수 있게 함
+            # (url이 UNIQUE라 빈 본문으로 저장하면 다시 수집되지 않음)
+            fetched = [(item, content) for item, content in zip(items, contents) if content is not None]
+            if len(fetched) < len(items):
+                with self._seen_lock:
+                    self.seen_urls.difference_update(
+                        item['url'] for item, content in zip(items, contents) if content is None
+                    )
             
-            # 요약 생성 (첫 2-3문장, 품질 고려)
-            sentences = re.split(r'[.!?]\s+', content)
-            meaningful_sentences = [s for s in sentences if len(s.strip()) > 20]
-            summary = '. '.join(meaningful_sentences[:3])[:300] if meaningful_sentences else content[:200]
+            # 저장된 본문 지문 DB 조회만 종목 단위로 한 번에 스레드에서 실행
+            # (품질 검증은 검증기 캐시를 쓰므로 이벤트 루프에서 실행)
+            stored_hashes = await asyncio.to_thread(
+                self.quality_validator.stored_content_hashes, [content for _, (content, _) in fetched]
+            )
             
-            return content, summary
+            for item, (content, summary) in fetched:
+                news_data = self._build_verified_news(stock_code, stock_name, item, content, summary,
+                                                      stored_hashes)
+                if news_data:
+                    news_list.append(news_data)
             
         except Exception as e:
-            logger.debug(f"강화된 본문 추출 실패 - {url}: {e}")
-            return "", ""
-    
-    def _advanced_text_cleaning(self, text: str) -> str:
-        """강화된 텍스트 정제 (중복 해결 개선)"""
-        if not text:
-            return ""
+            print(f"❌ {stock_code}({stock_name}) 뉴스 수집 실패: {e}")
         
-        # 1. 유니코드 정규화
-        text = unicodedata.normalize('NFKC', text)
+        # 종목 단위로 필터링 로그 일괄 저장
+        if flush_log:
+            await asyncio.to_thread(self._flush_filter_log)
         
-        # 2. HTML 태그 및 엔티티 제거
-        text = re.sub(r'<[^>]+>', ' ', text)
-        text = re.sub(r'&[a-zA-Z0-9#]+;', ' ', text)
+        return news_list
+    
+    @staticmethod
+    def _published_cutoff(days):
+        """수집 기간 시작일 ('YYYY-MM-DD', published_date 문자열과 바로 비교)"""
+        return (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
+    
+    def _parse_news_list(self, html):
+        """📋 뉴스 목록 페이지에서 제목/링크/날짜/출처 추출"""
+        items = []
+        
+        for title, href, date_text, source in self._iter_news_rows(html):
+            try:
+                # 날짜 추출
+                if date_text:
+                    published_date = self.parse_date(date_text)
+                else:
+                    published_date = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                
+                items.append({
+                    'title': title,
+                    'url': urljoin("https://finance.naver.com", href),
+                    'published_date': published_date,
+                    'source': source or '네이버금융'
+                })
+                
+            except Exception as e:
+                print(f"  ⚠️ 뉴스 항목 파싱 실패: {e}")
+                continue
         
-        # 3. 불필요한 문구 제거 (확장)
-        patterns_to_remove = [
-            r'// flash 오류를 우회하기 위한 함수 추가.*',
-            r'본\s*기사는.*?입니다',
-            r'저작권자.*?무단.*?금지',
-            r'ⓒ.*?무단.*?금지',
-            r'Copyright.*?All.*?rights.*?reserved',
-            r'기자\s*=.*?기자',
-            r'^\s*\[.*?\]\s*',
-            r'\s*\[.*?\]\s*
-            ,
-            r'이\s*메일.*?보내기',
-            r'카카오톡.*?공유',
-            r'페이스북.*?공유',
-            r'트위터.*?공유',
-            r'무단전재.*?금지',
-            r'네이버.*?블로그',
-            r'관련.*?뉴스',
-            r'이전.*?기사',
-            r'다음.*?기사',
-            r'.*?구독.*?알림',
-            r'.*?팔로우.*?',
-            r'광고.*?문의',
-            r'제보.*?tip',
-            r'더보기.*?클릭',
-            r'동영상.*?보기'
-        ]
+        return items
+    
+    def _iter_news_rows(self, html):
+        """목록 페이지 각 행의 (제목, 링크, 날짜, 출처) 추출 (lxml XPath 우선, 없으면 BeautifulSoup)"""
+        if lxml_html is not None:
+            if isinstance(html, bytes):
+                parser = lxml_html.HTMLParser(encoding=self._sniff_encoding(html))
+                tree = lxml_html.document_fromstring(html, parser=parser)
+            else:
+                tree = lxml_html.fromstring(html)
+            
+            for row in NEWS_ROW_XPATH(tree):
+                links = NEWS_TITLE_LINK_XPATH(row)
+                if not links:
+                    continue
+                
+                dates = NEWS_DATE_XPATH(row)
+                infos = NEWS_INFO_XPATH(row)
+                
+                yield (
+                    links[0].text_content().strip(),
+                    links[0].get('href'),
+                    dates[0].text_content().strip() if dates else '',
+                    infos[0].text_content().strip() if infos else ''
+                )
+            return
+        
+        soup = BeautifulSoup(html, HTML_PARSER, parse_only=self.LIST_STRAINER)
+        
+        for row in soup.select('.tb_cont tr'):
+            title_elem = row.select_one('.title a')
+            if not title_elem:
+                continue
+            
+            date_elem = row.select_one('.date')
+            info_elem = row.select_one('.info')
+            
+            yield (
+                title_elem.get_text(strip=True),
+                title_elem.get('href'),
+                date_elem.get_text(strip=True) if date_elem else '',
+                info_elem.get_text(strip=True) if info_elem else ''
+            )
+    
+    def _filter_new_items(self, items):
+        """🔁 목록 내 중복, 이번 실행에서 이미 요청한 URL, DB에 저장된 URL을 제외한 신규 항목만 반환"""
+        unique_items = {}
+        for item in items:
+            unique_items.setdefault(item['url'], item)
+        
+        # 다른 종목 목록에서 이미 처리한 기사는 DB 조회 없이 제외 (품질 미달로 저장되지 않은 기사 포함)
+        with self._seen_lock:
+            seen = [url for url in unique_items if url in self.seen_urls]
+            for url in seen:
+                del unique_items[url]
+            self.seen_urls.update(unique_items)
+        self._count('duplicate_count', len(seen))
+        
+        urls = list(unique_items)
+        if not urls:
+            return []
+        
+        existing = set()
+        try:
+            conn = self._read_conn()
+            # SQLite 바인딩 변수 개수 제한을 고려해 나눠서 조회
+            for i in range(0, len(urls), 500):
+                chunk = urls[i:i + 500]
+                placeholders = ','.join('?' * len(chunk))
+                rows = conn.execute(
+                    f'SELECT url FROM news_articles WHERE url IN ({placeholders})', chunk
+                )
+                existing.update(row[0] for row in rows)
+        except Exception as e:
+            logger.debug(f"기존 URL 조회 실패: {e}")
+        
+        self._count('duplicate_count', len(existing))
+        
+        return [item for url, item in unique_items.items() if url not in existing]
+    
+    def _count(self, key, n=1):
+        """수집 통계 증가 (수집 스레드와 저장 스레드가 함께 갱신하므로 잠금 안에서 수행)"""
+        with self._stats_lock:
+            self.stats[key] += n
+    
+    def _record_rejection(self, stock_code, item, issues, quality_score):
+        """품질 검증 탈락 뉴스의 로그/통계 기록"""
+        self._log_filtered_news(stock_code, item['title'], item['url'], issues, quality_score)
+        self._count('quality_failed')
+        
+        if '스팸 패턴 감지' in issues:
+            self._count('spam_filtered')
+        if '콘텐츠 품질 부족' in issues:
+            self._count('low_quality_filtered')
+    
+    def _select_fetch_candidates(self, stock_code, items):
+        """🔎 본문을 요청할 뉴스만 선별 (신규 URL 중 제목 사전 검사를 통과한 항목)"""
+        return self._prevalidate_items(stock_code, self._filter_new_items(items))
+    
+    def _prevalidate_items(self, stock_code, items):
+        """🔎 제목 사전 검사를 통과해 본문 요청이 필요한 항목만 반환"""
+        candidates = []
+        for item in items:
+            may_pass, quality_score, issues = self.quality_validator.prevalidate_title(item['title'])
+            if may_pass:
+                candidates.append(item)
+            else:
+                # 제목만으로 탈락이 확정되면 본문 요청 생략
+                self._record_rejection(stock_code, item, issues, quality_score)
         
-        for pattern in patterns_to_remove:
-            text = re.sub(pattern, '', text, flags=re.IGNORECASE | re.DOTALL)
+        return candidates
+    
+    def _build_verified_news(self, stock_code, stock_name, item, content, summary, stored_hashes=None):
+        """🛡️ 뉴스 데이터 구성 및 품질 검증 (통과 시 dict, 실패 시 None)"""
+        news_data = {
+            'stock_code': stock_code,
+            'stock_name': stock_name,
+            'title': item['title'],
+            'content': content,
+            'summary': summary,
+            'url': item['url'],
+            'source': f"네이버금융-{item['source']}",
+            'published_date': item['published_date'],
+            'collected_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        }
+        
+        is_valid, quality_score, issues = self.quality_validator.validate_news(news_data, stored_hashes)
+        
+        if not is_valid:
+            self._record_rejection(stock_code, item, issues, quality_score)
+            return None
+        
+        # 품질 정보 추가
+        news_data['quality_score'] = quality_score
+        news_data['quality_issues'] = ', '.join(issues) if issues else ''
+        news_data['is_verified'] = True
+        news_data['credibility_rating'] = self._get_credibility_rating(quality_score)
+        self._count('quality_passed')
+        
+        return news_data
+    
+    def get_enhanced_news_content(self, url):
+        """
+        📄 강화된 뉴스 상세 내용 추출
+        
+        Args:
+            url (str): 뉴스 URL
+            
+        Returns:
+            tuple: (content, summary)
+        """
+        try:
+            # 본문은 앞부분만 필요하므로 스트리밍으로 최대 크기까지만 읽음
+            self.rate_limiter.acquire()
+            with self.session.get(url, stream=True, timeout=self.CONTENT_TIMEOUT) as response:
+                response.raise_for_status()
+                
+                if lxml_html is not None:
+                    # 소켓에서 읽은 청크를 바로 lxml 파서에 넘겨 본문 bytes 사본을 만들지 않음
+                    return self._parse_news_tree(self._stream_to_lxml(response))
+                
+                raw = response.raw.read(self.MAX_CONTENT_BYTES, decode_content=True)
+            
+            # 인코딩은 BeautifulSoup이 meta 태그/바이트로 판별
+            return self._parse_news_content(raw)
+            
+        except Exception as e:
+            logger.debug(f"강화된 본문 추출 실패 - {url}: {e}")
+            return "", ""
+    
+    @staticmethod
+    def _sniff_encoding(head):
+        """문서 앞부분에 meta charset이 있으면 None(lxml이 판별), 없으면 UTF-8"""
+        return None if b'charset' in head[:4096].lower() else 'utf-8'
+    
+    def _stream_to_lxml(self, response):
+        """📄 스트리밍 응답을 최대 MAX_CONTENT_BYTES까지 lxml 파서에 직접 공급하여 루트 요소 반환"""
+        chunks = response.raw.stream(64 * 1024, decode_content=True)
+        first = next(chunks, b'')
+        
+        # 인코딩: 헤더 charset → 문서 meta charset(lxml이 판별) → 둘 다 없으면 UTF-8
+        if 'charset=' in response.headers.get('Content-Type', '').lower():
+            encoding = response.encoding
+        else:
+            encoding = self._sniff_encoding(first)
+        
+        parser = lxml_html.HTMLParser(encoding=encoding)
+        parser.feed(first[:self.MAX_CONTENT_BYTES])
+        remaining = self.MAX_CONTENT_BYTES - len(first)
+        
+        while remaining > 0:
+            chunk = next(chunks, None)
+            if chunk is None:
+                break
+            parser.feed(chunk[:remaining])
+            remaining -= len(chunk)
+        
+        return parser.close()
+    
+    def _parse_news_tree(self, root):
+        """📄 lxml 트리에서 (content, summary) 추출 (_parse_news_content와 같은 규칙)"""
+        content = ""
+        content_elem = None
+        for xpath in self.CONTENT_XPATHS:
+            elems = xpath(root)
+            if elems:
+                content_elem = elems[0]
+                break
+        
+        if content_elem is not None:
+            # 광고, 관련기사 등 제거 (강화)
+            for unwanted in NEWS_UNWANTED_XPATH(content_elem):
+                unwanted.drop_tree()
+            
+            # 광고 관련 클래스 제거
+            for elem in NEWS_CLASSED_XPATH(content_elem):
+                if any(AD_CLASS_RE.search(cls) for cls in elem.get('class', '').split()):
+                    elem.drop_tree()
+            
+            content = ' '.join(text.strip() for text in content_elem.itertext() if text.strip())
+        
+        return self._summarize_content(self._advanced_text_cleaning(content))
+    
+    def _select_content_elem(self, html):
+        """📄 본문 후보 요소만 부분 파싱하여 첫 번째로 일치하는 본문 요소 반환"""
+        for strainer in self.CONTENT_STRAINERS:
+            soup = BeautifulSoup(html, HTML_PARSER, parse_only=strainer)
+            for selector in self.CONTENT_SELECTORS:
+                content_elem = soup.select_one(selector)
+                if content_elem:
+                    return content_elem
+        
+        return None
+    
+    def _parse_news_content(self, html):
+        """📄 뉴스 본문 HTML(str 또는 bytes)에서 (content, summary) 추출"""
+        try:
+            if lxml_html is not None:
+                # lxml(C 파서)이 있으면 BeautifulSoup 대신 lxml 트리로 추출
+                if isinstance(html, bytes):
+                    parser = lxml_html.HTMLParser(encoding=self._sniff_encoding(html))
+                    return self._parse_news_tree(lxml_html.document_fromstring(html, parser=parser))
+                return self._parse_news_tree(lxml_html.document_fromstring(html))
+            
+            content = ""
+            content_elem = self._select_content_elem(html)
+            if content_elem:
+                # 광고, 관련기사 등 제거 (강화)
+                for unwanted in content_elem.select(self.UNWANTED_SELECTOR):
+                    unwanted.decompose()
+                
+                # 광고 관련 클래스 제거
+                for elem in content_elem.select(self.AD_CLASS_SELECTOR):
+                    elem.decompose()
+                
+                content = content_elem.get_text(separator=' ', strip=True)
+            
+            # 강화된 텍스트 정제
+            return self._summarize_content(self._advanced_text_cleaning(content))
+            
+        except Exception as e:
+            logger.debug(f"본문 파싱 실패: {e}")
+            return "", ""
+    
+    def _summarize_content(self, content):
+        """📝 정제된 본문에서 요약 생성 (첫 2-3문장, 품질 고려) → (content, summary)"""
+        sentences = SENTENCE_SPLIT_RE.split(content)
+        meaningful_sentences = [s for s in sentences if len(s.strip()) > 20]
+        summary = '. '.join(meaningful_sentences[:3])[:300] if meaningful_sentences else content[:200]
+        
+        return content, summary
+    
+    def _advanced_text_cleaning(self, text: str) -> str:
+        """강화된 텍스트 정제 (중복 해결 개선)"""
+        if not text:
+            return ""
+        
+        # 1. 유니코드 정규화
+        text = unicodedata.normalize('NFKC', text)
+        
+        # 2. HTML 태그 및 엔티티 제거
+        text = HTML_TAG_RE.sub(' ', text)
+        text = HTML_ENTITY_RE.sub(' ', text)
+        
+        # 3. 불필요한 문구 제거 (확장)
+        for pattern in BOILERPLATE_RES:
+            text = pattern.sub('', text)
         
         # 4. 특수 문자 정리
-        text = re.sub(r'[&\[\]{}()\*\+\?\|\^\$\\.~`!@#%=:;",<>]', ' ', text)
+        text = SPECIAL_CHAR_RE.sub(' ', text)
         
         # 5. 숫자와 한글 사이 공백
-        text = re.sub(r'(\d)([가-힣])', r'\1 \2', text)
-        text = re.sub(r'([가-힣])(\d)', r'\1 \2', text)
+        text = DIGIT_HANGUL_RE.sub(r'\1 \2', text)
+        text = HANGUL_DIGIT_RE.sub(r'\1 \2', text)
         
         # 6. 강화된 중복 제거
         words = text.split()
@@ -724,19 +1691,14 @@ class EnhancedNewsCollector:
         text = ' '.join(cleaned_words)
         
         # 7. 중복 패턴 제거 (정규표현식, 개선)
-        text = re.sub(r'([가-힣A-Za-z0-9]{2,})\1{2,}', r'\1', text)  # 3번 이상 반복
+        text = REPEATED_WORD_RE.sub(r'\1', text)  # 3번 이상 반복
         
-        # 8. 반복 구문 제거 (개선된 알고리즘)
-        def remove_repeating_patterns(text):
-            for length in range(3, 20):  # 더 긴 패턴도 감지
-                pattern = f'(.{{{length}}})(\\1)+'
-                text = re.sub(pattern, r'\1', text)
-            return text
-        
-        text = remove_repeating_patterns(text)
+        # 8. 반복 구문 제거 (3~19자 패턴, 더 긴 패턴도 감지)
+        for pattern in REPEATING_PATTERN_RES:
+            text = pattern.sub(r'\1', text)
         
         # 9. 여러 공백을 하나로
-        text = re.sub(r'\s+', ' ', text)
+        text = WHITESPACE_RE.sub(' ', text)
         
         # 10. 최종 정리
         text = text.strip()
@@ -757,106 +1719,133 @@ class EnhancedNewsCollector:
             return 'VERY_POOR'
     
     def _log_filtered_news(self, stock_code: str, title: str, url: str, issues: List[str], quality_score: int):
-        """필터링된 뉴스 로그 저장"""
+        """필터링된 뉴스 로그를 버퍼에 추가 (_flush_filter_log에서 일괄 저장)"""
+        row = (
+            stock_code,
+            title[:200],  # 제목 길이 제한
+            url,
+            ', '.join(issues),
+            quality_score,
+            datetime.now().isoformat()
+        )
+        with self._filter_log_lock:
+            self._filter_log_buffer.append(row)
+    
+    def _flush_filter_log(self):
+        """버퍼에 쌓인 필터링 로그를 단일 트랜잭션으로 저장"""
+        with self._filter_log_lock:
+            rows, self._filter_log_buffer = self._filter_log_buffer, []
+        
+        if not rows:
+            return
+        
+        conn = self._connect()
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute('''
-                    INSERT INTO quality_filter_log 
-                    (stock_code, title, url, filter_reason, quality_score, filtered_date)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                ''', (
-                    stock_code,
-                    title[:200],  # 제목 길이 제한
-                    url,
-                    ', '.join(issues),
-                    quality_score,
-                    datetime.now().isoformat()
-                ))
-                conn.commit()
+            insert_rows_multi(conn.cursor(), '''
+                INSERT INTO quality_filter_log 
+                (stock_code, title, url, filter_reason, quality_score, filtered_date)
+                VALUES 
+            ''', rows, cols_per_row=6)
+            conn.commit()
         except Exception as e:
+            conn.rollback()
             logger.error(f"필터링 로그 저장 실패: {e}")
+        finally:
+            conn.close()
     
     def parse_date(self, date_str):
         """📅 날짜 문자열 파싱 (개선)"""
         try:
-            # "07.05" 형태
-            if re.match(r'\d{2}\.\d{2}
-            , date_str):
-                current_year = datetime.now().year
-                month, day = date_str.split('.')
-                return f"{current_year}-{month}-{day} 00:00:00"
-            
             # "07.05 15:30" 형태
-            elif re.match(r'\d{2}\.\d{2} \d{2}:\d{2}', date_str):
-                current_year = datetime.now().year
-                date_part, time_part = date_str.split(' ')
-                month, day = date_part.split('.')
-                return f"{current_year}-{month}-{day} {time_part}:00"
+            match = DATE_MMDD_TIME_RE.match(date_str)
+            if match:
+                month, day, time_part = match.groups()
+                return f"{datetime.now().year}-{month}-{day} {time_part}:00"
             
-            # "2024.07.05" 형태
-            elif re.match(r'\d{4}\.\d{2}\.\d{2}', date_str):
-                year, month, day = date_str.split('.')
-                return f"{year}-{month}-{day} 00:00:00"
+            # "07.05" 형태
+            match = DATE_MMDD_RE.match(date_str)
+            if match:
+                month, day = match.groups()
+                return f"{datetime.now().year}-{month}-{day} 00:00:00"
+            
+            # "2024.07.05" / "2024.07.05 15:30" 형태
+            match = DATE_YYYYMMDD_RE.match(date_str)
+            if match:
+                year, month, day, time_part = match.groups()
+                return f"{year}-{month}-{day} {time_part or '00:00'}:00"
             
             # 기타 형태는 현재 시간 반환
-            else:
-                return datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            return datetime.now().strftime('%Y-%m-%d %H:%M:%S')
                 
         except:
             return datetime.now().strftime('%Y-%m-%d %H:%M:%S')
     
     def save_news_to_db(self, news_list):
-        """📚 뉴스 데이터를 DB에 저장 (품질 정보 포함)"""
+        """📚 뉴스 데이터를 DB에 저장 (품질 정보 포함, 단일 트랜잭션 일괄 저장)"""
         if not news_list:
             return 0
         
+        rows = [
+            (
+                news.get('stock_code', ''),
+                news.get('stock_name', ''),
+                news.get('title', ''),
+                news.get('content', ''),
+                news.get('summary', ''),
+                news.get('url', ''),
+                news.get('source', ''),
+                news.get('published_date', ''),
+                news.get('collected_date', ''),
+                news.get('quality_score', 0),
+                news.get('quality_issues', ''),
+                news.get('is_verified', True),
+                news.get('credibility_rating', 'UNKNOWN'),
+                normalize_news_text(news.get('title'), news.get('summary')),
+                news_title_hash(news.get('title'), news.get('source'), news.get('published_date'))
+            )
+            for news in news_list
+        ]
+        
+        conn = self._connect()
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                
-                saved_count = 0
-                for news in news_list:
-                    try:
-                        cursor.execute('''
-                            INSERT OR IGNORE INTO news_articles 
-                            (stock_code, stock_name, title, content, summary, url, source, 
-                             published_date, collected_date, quality_score, quality_issues, 
-                             is_verified, credibility_rating)
-                            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        ''', (
-                            news.get('stock_code', ''),
-                            news.get('stock_name', ''),
-                            news.get('title', ''),
-                            news.get('content', ''),
-                            news.get('summary', ''),
-                            news.get('url', ''),
-                            news.get('source', ''),
-                            news.get('published_date', ''),
-                            news.get('collected_date', ''),
-                            news.get('quality_score', 0),
-                            news.get('quality_issues', ''),
-                            news.get('is_verified', True),
-                            news.get('credibility_rating', 'UNKNOWN')
-                        ))
-                        
-                        if cursor.rowcount > 0:
-                            saved_count += 1
-                        else:
-                            self.stats['duplicate_count'] += 1
-                            
-                    except Exception as e:
-                        print(f"  ⚠️ 뉴스 저장 실패: {e}")
-                        continue
-                
-                conn.commit()
-                return saved_count
-                
+            cursor = conn.cursor()
+            # 처음부터 쓰기 잠금을 잡아 저장 전 마지막 id 이후 행이 이번 배치 것임을 보장
+            cursor.execute('BEGIN IMMEDIATE')
+            last_id = cursor.execute('SELECT COALESCE(MAX(id), 0) FROM news_articles').fetchone()[0]
+            
+            changes_before = conn.total_changes
+            insert_rows_multi(cursor, '''
+                INSERT OR IGNORE INTO news_articles 
+                (stock_code, stock_name, title, content, summary, url, source, 
+                 published_date, collected_date, quality_score, quality_issues, 
+                 is_verified, credibility_rating, text_norm, title_hash)
+                VALUES 
+            ''', rows, cols_per_row=15)
+            saved_count = conn.total_changes - changes_before
+            
+            # 실제로 저장된 행의 본문 지문만 같은 트랜잭션에서 기록 (무시된 중복 행 제외)
+            if saved_count:
+                saved_contents = cursor.execute(
+                    'SELECT content FROM news_articles WHERE id > ?', (last_id,)
+                ).fetchall()
+                self.quality_validator.record_content_hashes(cursor, (row[0] for row in saved_contents))
+            
+            conn.commit()
+            
         except Exception as e:
+            # 일부만 저장되지 않도록 배치 전체를 되돌림
+            conn.rollback()
             print(f"❌ 뉴스 DB 저장 실패: {e}")
             return 0
+        
+        finally:
+            conn.close()
+        
+        # INSERT OR IGNORE로 무시된 행 = 중복 (URL 또는 제목 지문)
+        self._count('duplicate_count', len(news_list) - saved_count)
+        return saved_count
     
-    def collect_all_stock_news(self, days=7, max_stocks=None, max_workers=3):
+    def collect_all_stock_news(self, days=7, max_stocks=None, max_workers=3, confirm=True):
         """
         🚀 모든 종목의 뉴스 수집 (품질 검증 통합)
         
@@ -864,6 +1853,7 @@ class EnhancedNewsCollector:
             days (int): 수집할 일수
             max_stocks (int): 최대 종목 수 (None이면 전체)
             max_workers (int): 동시 처리 스레드 수
+            confirm (bool): 시작 전 사용자 확인 여부 (스크립트 실행 시 False)
         """
         print("🚀 강화된 전체 종목 뉴스 수집 시작!")
         print("=" * 60)
@@ -879,64 +1869,228 @@ class EnhancedNewsCollector:
         
         print(f"📊 총 {len(stock_list)}개 종목 뉴스 수집 예정")
         print(f"📅 수집 기간: 최근 {days}일")
-        print(f"🧵 동시 처리: {max_workers}개 스레드")
+        if aiohttp is not None:
+            print(f"⚡ 비동기 수집: 최대 {max_workers * 8}개 종목 동시 처리")
+        else:
+            print(f"🧵 동시 처리: {max_workers}개 스레드")
         print(f"🛡️ 품질 검증: 활성화 (70점 이상만 저장)")
         
         estimated_time = len(stock_list) * 30 / max_workers / 60  # 분 단위
         print(f"⏱️  예상 소요시간: 약 {estimated_time:.1f}분")
         
-        confirm = input(f"\n고품질 뉴스 수집을 시작하시겠습니까? (y/N): ").strip().lower()
-        if confirm != 'y':
-            print("👋 수집을 취소했습니다.")
-            return
+        if confirm:
+            answer = input(f"\n고품질 뉴스 수집을 시작하시겠습니까? (y/N): ").strip().lower()
+            if answer != 'y':
+                print("👋 수집을 취소했습니다.")
+                return
         
-        # 멀티스레딩으로 수집
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # 작업 제출
-            future_to_stock = {}
-            for stock in stock_list:
-                future = executor.submit(
-                    self.collect_stock_news_worker, 
-                    stock['stock_code'], 
-                    stock['stock_name'], 
-                    days
-                )
-                future_to_stock[future] = stock
+        # 수집기를 재사용하므로 이전 실행의 통계와 요청 URL 기록은 초기화
+        self.stats = dict.fromkeys(self.stats, 0)
+        self.seen_urls.clear()
+        
+        # 캐시된 수집기는 기본 워커 수로 만들어지므로 이번 실행 워커 수에 맞춰 풀/속도 제한 조정
+        self._configure_workers(max_workers)
+        
+        # 대량 적재 시 인덱스를 제거했다가 수집 후 한 번에 재생성
+        bulk_load = self._is_bulk_load(len(stock_list))
+        if bulk_load:
+            print("🗂️ 대량 적재 모드: 수집 완료 후 인덱스 재생성")
+            self._drop_news_indexes()
+        
+        try:
+            if aiohttp is not None:
+                # 비동기 수집 (단일 스레드에서 요청을 동시에 처리)
+                asyncio.run(self._collect_all_async(stock_list, days, max_workers))
+            else:
+                # 멀티스레딩으로 수집
+                self._collect_all_threaded(stock_list, days, max_workers)
+        finally:
+            if bulk_load:
+                self._create_indexes(analyze=True)
+        
+        # 수집 결과 출력
+        self.print_enhanced_collection_summary()
+    
+    def _async_session(self, limit):
+        """aiohttp 세션 생성 (requests 세션과 같은 헤더 사용)"""
+        # 연결 수 상한 + DNS 조회 결과 캐시 (종목마다 같은 호스트를 반복 조회하지 않도록)
+        connector = aiohttp.TCPConnector(limit=limit, limit_per_host=4, ttl_dns_cache=300)
+        
+        # Accept-Encoding은 aiohttp가 자신이 해제할 수 있는 방식으로 직접 설정
+        headers = {k: v for k, v in self.session.headers.items() if k.lower() != 'accept-encoding'}
+        return aiohttp.ClientSession(headers=headers, connector=connector)
+    
+    def collect_stock_news(self, stock_code, stock_name, days=7):
+        """
+        📰 특정 종목 뉴스 수집 (aiohttp가 있으면 목록/본문을 비동기로 동시 요청)
+        
+        Args:
+            stock_code (str): 종목코드
+            stock_name (str): 종목명
+            days (int): 수집할 일수
             
-            # 진행률 표시
-            progress_bar = tqdm(
-                as_completed(future_to_stock), 
-                total=len(stock_list),
-                desc="📰 고품질 뉴스 수집",
-                unit="종목"
-            )
+        Returns:
+            list: 수집된 고품질 뉴스 리스트
+        """
+        if aiohttp is None:
+            return self.collect_naver_finance_news(stock_code, stock_name, days)
+        
+        async def collect():
+            async with self._async_session(8) as session:
+                return await self.collect_naver_finance_news_async(session, stock_code, stock_name, days)
+        
+        return asyncio.run(collect())
+    
+    async def _collect_all_async(self, stock_list, days, max_workers):
+        """⚡ aiohttp 기반 전체 종목 비동기 수집"""
+        semaphore = asyncio.Semaphore(max_workers * 8)
+        async with self._async_session(max_workers * 8) as session:
             
-            for future in progress_bar:
-                stock = future_to_stock[future]
-                stock_code = stock['stock_code']
-                stock_name = stock['stock_name']
-                
+            async def worker(stock):
                 try:
-                    news_count = future.result()
-                    self.stats['success_count'] += 1
-                    self.stats['total_collected'] += news_count
-                    
-                    # 품질 통과율 계산
-                    total_processed = self.stats['quality_passed'] + self.stats['quality_failed']
-                    quality_rate = (self.stats['quality_passed'] / max(total_processed, 1)) * 100
-                    
-                    progress_bar.set_postfix({
-                        'Current': f"{stock_code}({stock_name[:8]})",
-                        '고품질': self.stats['total_collected'],
-                        '품질률': f"{quality_rate:.1f}%"
-                    })
+                    async with semaphore:
+                        news_list = await self.collect_naver_finance_news_async(
+                            session, stock['stock_code'], stock['stock_name'], days, flush_log=False
+                        )
+                    return stock, news_list, None
+                except Exception as e:
+                    return stock, [], e
+            
+            progress_bar = tqdm(total=len(stock_list), desc="📰 고품질 뉴스 수집", unit="종목",
+                            mininterval=0.5)
+            
+            # 종목별 결과를 모아 NEWS_BATCH_SIZE 단위로 저장 스레드에 전달 (중단되어도 모은 분량은 저장)
+            write_queue, writer = self._start_news_writer()
+            buffer = []
+            try:
+                for next_done in asyncio.as_completed([worker(stock) for stock in stock_list]):
+                    stock, news_list, error = await next_done
+                    self._record_stock_result(progress_bar, stock, error)
+                    progress_bar.update(1)
                     
+                    buffer.extend(news_list)
+                    if len(buffer) >= self.NEWS_BATCH_SIZE:
+                        batch, buffer = buffer, []
+                        # 저장이 밀려 큐가 찬 경우에도 이벤트 루프는 막지 않음
+                        await asyncio.to_thread(write_queue.put, batch)
+            finally:
+                self._stop_news_writer(write_queue, writer, buffer)
+                progress_bar.close()
+    
+    def _collect_all_threaded(self, stock_list, days, max_workers):
+        """🧵 제한된 작업 큐 기반 전체 종목 수집 (aiohttp 미설치 시)"""
+        # 생산자-소비자: 큐 크기를 제한해 대기 작업이 한꺼번에 쌓이지 않도록 함
+        task_queue = queue.Queue(maxsize=max_workers * 2)
+        result_queue = queue.Queue()
+        
+        def producer():
+            for stock in stock_list:
+                task_queue.put(stock)
+            for _ in range(max_workers):
+                task_queue.put(None)  # 종료 신호
+        
+        def worker():
+            while True:
+                stock = task_queue.get()
+                if stock is None:
+                    break
+                try:
+                    news_list = self.collect_naver_finance_news(stock['stock_code'], stock['stock_name'], days,
+                                                                flush_log=False)
+                    result_queue.put((stock, news_list, None))
                 except Exception as e:
-                    self.stats['fail_count'] += 1
-                    print(f"\n❌ {stock_code}({stock_name}) 뉴스 수집 실패: {e}")
+                    result_queue.put((stock, [], e))
         
-        # 수집 결과 출력
-        self.print_enhanced_collection_summary()
+        threads = [threading.Thread(target=producer, daemon=True)]
+        threads += [threading.Thread(target=worker, daemon=True) for _ in range(max_workers)]
+        for thread in threads:
+            thread.start()
+        
+        # 진행률 표시
+        progress_bar = tqdm(total=len(stock_list), desc="📰 고품질 뉴스 수집", unit="종목",
+                            mininterval=0.5)
+        
+        # 종목별 결과를 모아 NEWS_BATCH_SIZE 단위로 저장 스레드에 전달 (중단되어도 모은 분량은 저장)
+        write_queue, writer = self._start_news_writer()
+        buffer = []
+        try:
+            for _ in range(len(stock_list)):
+                stock, news_list, error = result_queue.get()
+                self._record_stock_result(progress_bar, stock, error)
+                progress_bar.update(1)
+                
+                buffer.extend(news_list)
+                if len(buffer) >= self.NEWS_BATCH_SIZE:
+                    batch, buffer = buffer, []
+                    write_queue.put(batch)
+        finally:
+            self._stop_news_writer(write_queue, writer, buffer)
+            progress_bar.close()
+        
+        for thread in threads:
+            thread.join()
+    
+    def _start_news_writer(self):
+        """
+        🗄️ 뉴스 저장 전용 스레드 시작
+        
+        수집 스레드/코루틴은 DB에 쓰지 않고, 뉴스 배치와 필터링 로그를 이 스레드 하나가
+        순서대로 저장합니다 (SQLite 쓰기 잠금 경합 제거, 저장 중에도 결과 수신 계속).
+        """
+        write_queue = queue.Queue(maxsize=self.WRITE_QUEUE_SIZE)
+        writer = threading.Thread(target=self._news_writer_loop, args=(write_queue,), daemon=True)
+        writer.start()
+        return write_queue, writer
+    
+    def _news_writer_loop(self, write_queue):
+        """🗄️ 큐에서 뉴스 배치를 꺼내 저장 (None을 받으면 종료)"""
+        while True:
+            batch = write_queue.get()
+            if batch is None:
+                break
+            self._save_news_batch(batch)
+            self._flush_filter_log()
+    
+    def _stop_news_writer(self, write_queue, writer, remaining):
+        """🗄️ 남은 뉴스를 넘기고 저장 스레드가 모두 저장할 때까지 대기"""
+        write_queue.put(remaining)
+        write_queue.put(None)
+        writer.join()
+    
+    def _save_news_batch(self, news_batch):
+        """📚 누적된 뉴스를 한 트랜잭션으로 저장하고 저장 건수를 통계에 반영"""
+        saved_count = self.save_news_to_db(news_batch)
+        self._count('total_collected', saved_count)
+        return saved_count
+    
+    def _record_stock_result(self, progress_bar, stock, error=None):
+        """📊 종목별 수집 결과를 통계와 진행률에 반영"""
+        stock_code = stock['stock_code']
+        stock_name = stock['stock_name']
+        
+        if error is not None:
+            self._count('fail_count')
+            print(f"\n❌ {stock_code}({stock_name}) 뉴스 수집 실패: {error}")
+            return
+        
+        self._count('success_count')
+        
+        # postfix 문자열은 POSTFIX_INTERVAL마다 한 번만 생성
+        now = time.monotonic()
+        if now - self._last_postfix_time < self.POSTFIX_INTERVAL:
+            return
+        self._last_postfix_time = now
+        
+        # 품질 통과율 계산
+        total_processed = self.stats['quality_passed'] + self.stats['quality_failed']
+        quality_rate = (self.stats['quality_passed'] / max(total_processed, 1)) * 100
+        
+        # 다시 그리기는 update()의 mininterval 주기에 맡김 (종목마다 강제로 그리지 않음)
+        progress_bar.set_postfix_str(
+            f"Current={stock_code}({stock_name[:8]}), "
+            f"고품질={self.stats['quality_passed']}, 품질률={quality_rate:.1f}%",
+            refresh=False
+        )
     
     def collect_stock_news_worker(self, stock_code, stock_name, days):
         """📰 개별 종목 뉴스 수집 (품질 검증 워커)"""
@@ -980,7 +2134,7 @@ class EnhancedNewsCollector:
     def query_db(self, query, params=None):
         """DB 쿼리 실행"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._read_conn() as conn:
                 if params:
                     return pd.read_sql_query(query, conn, params=params)
                 else:
@@ -989,59 +2143,124 @@ class EnhancedNewsCollector:
             print(f"❌ 쿼리 실행 실패: {e}")
             return pd.DataFrame()
     
-    def get_enhanced_news_summary(self):
-        """📊 강화된 뉴스 수집 현황 요약"""
-        print("📊 강화된 뉴스 수집 현황")
-        print("=" * 50)
+    def fetch_rows(self, query, params=()):
+        """
+        DB 쿼리 실행 후 sqlite3.Row 리스트 반환
         
-        # 전체 뉴스 수 (품질별)
-        total_stats = self.query_db("""
-            SELECT 
-                COUNT(*) as total_news,
-                COUNT(CASE WHEN is_verified = 1 THEN 1 END) as verified_news,
-                AVG(quality_score) as avg_quality,
-                COUNT(CASE WHEN quality_score >= 80 THEN 1 END) as high_quality_news
-            FROM news_articles
-        """).iloc[0]
+        출력만 하는 작은 결과는 DataFrame을 만들지 않고 바로 읽습니다.
+        """
+        try:
+            cursor = self._read_conn().cursor()
+            cursor.row_factory = sqlite3.Row
+            return cursor.execute(query, params).fetchall()
+        except Exception as e:
+            print(f"❌ 쿼리 실행 실패: {e}")
+            return []
+    
+    def _summary_cache_key(self):
+        """
+        요약 캐시 키: (오늘 날짜, PRAGMA data_version)
         
-        print(f"📰 전체 뉴스: {total_stats['total_news']:,}건")
-        print(f"✅ 검증된 뉴스: {total_stats['verified_news']:,}건")
-        print(f"📊 평균 품질 점수: {total_stats['avg_quality']:.1f}점")
-        print(f"🏆 고품질 뉴스 (80점 이상): {total_stats['high_quality_news']:,}건")
+        data_version 은 다른 연결이 DB에 커밋할 때마다 바뀌므로
+        수집/감정 분석으로 데이터가 바뀌면 캐시가 자동으로 무효화됩니다.
+        """
+        try:
+            data_version = self._read_conn().execute("PRAGMA data_version").fetchone()[0]
+        except sqlite3.Error:
+            return None
+        return (datetime.now().date(), data_version)
+    
+    def _load_summary_frames(self):
+        """📊 요약용 집계 결과 조회 (DB 변경이 없으면 메모리 캐시 재사용)"""
+        cache_key = self._summary_cache_key()
+        if cache_key is not None and self._summary_cache is not None and self._summary_cache[0] == cache_key:
+            return self._summary_cache[1]
         
-        # 종목별 뉴스 수 (품질별, 상위 10개)
+        # 종목별 집계를 한 번만 스캔 (전체 합계는 이 결과에서 계산)
         stock_news = self.query_db("""
             SELECT 
                 stock_code, 
                 stock_name, 
                 COUNT(*) as news_count,
-                AVG(quality_score) as avg_quality,
-                COUNT(CASE WHEN is_verified = 1 THEN 1 END) as verified_count
+                SUM(quality_score) as quality_sum,
+                COUNT(quality_score) as quality_count,
+                COUNT(CASE WHEN is_verified = 1 THEN 1 END) as verified_count,
+                COUNT(CASE WHEN quality_score >= 80 THEN 1 END) as high_quality_count,
+                MIN(published_date) as first_date,
+                MAX(published_date) as last_date
             FROM news_articles
             GROUP BY stock_code, stock_name
-            ORDER BY news_count DESC
-            LIMIT 10
         """)
         
-        if not stock_news.empty:
-            print(f"\n📈 종목별 뉴스 (상위 10개):")
-            for _, row in stock_news.iterrows():
-                print(f"   {row['stock_code']} ({row['stock_name']}): {row['news_count']}건 "
-                      f"(검증: {row['verified_count']}건, 평균품질: {row['avg_quality']:.1f}점)")
-        
-        # 소스별 신뢰도
-        source_stats = self.query_db("""
+        # 소스별 신뢰도와 최근 7일 일별 통계를 한 번의 스캔으로 집계
+        # (7일 이전 기사는 day 가 NULL 인 그룹으로 묶여 소스 합계에만 반영)
+        source_day = self.query_db("""
+            WITH recent AS (
+                SELECT DATE('now', '-7 days') as cutoff
+            )
             SELECT 
-                source, 
+                source,
+                CASE WHEN published_date >= recent.cutoff
+                     THEN DATE(published_date) END as date,
                 COUNT(*) as count,
-                AVG(quality_score) as avg_quality,
+                SUM(quality_score) as quality_sum,
+                COUNT(quality_score) as quality_count,
                 COUNT(CASE WHEN is_verified = 1 THEN 1 END) as verified_count
-            FROM news_articles
-            GROUP BY source
-            ORDER BY avg_quality DESC, count DESC
-            LIMIT 10
+            FROM news_articles, recent
+            GROUP BY source, date
+        """)
+        
+        # 필터링 통계
+        filter_stats = self.fetch_rows("""
+            SELECT 
+                filter_reason,
+                COUNT(*) as count
+            FROM quality_filter_log
+            GROUP BY filter_reason
+            ORDER BY count DESC
         """)
         
+        frames = (stock_news, source_day, filter_stats)
+        if cache_key is not None:
+            self._summary_cache = (cache_key, frames)
+        return frames
+    
+    def get_enhanced_news_summary(self):
+        """📊 강화된 뉴스 수집 현황 요약"""
+        print("📊 강화된 뉴스 수집 현황")
+        print("=" * 50)
+        
+        stock_news, source_day, filter_stats = self._load_summary_frames()
+        
+        quality_count = stock_news['quality_count'].sum()
+        avg_quality = stock_news['quality_sum'].sum() / quality_count if quality_count else float('nan')
+        
+        print(f"📰 전체 뉴스: {stock_news['news_count'].sum():,}건")
+        print(f"✅ 검증된 뉴스: {stock_news['verified_count'].sum():,}건")
+        print(f"📊 평균 품질 점수: {avg_quality:.1f}점")
+        print(f"🏆 고품질 뉴스 (80점 이상): {stock_news['high_quality_count'].sum():,}건")
+        
+        # 종목별 뉴스 수 (품질별, 상위 10개)
+        if not stock_news.empty:
+            top_stocks = stock_news.sort_values('news_count', ascending=False, kind='stable').head(10)
+            avg_qualities = top_stocks['quality_sum'] / top_stocks['quality_count'].where(top_stocks['quality_count'] > 0)
+            
+            print(f"\n📈 종목별 뉴스 (상위 10개):")
+            for (_, row), stock_avg_quality in zip(top_stocks.iterrows(), avg_qualities):
+                print(f"   {row['stock_code']} ({row['stock_name']}): {row['news_count']}건 "
+                      f"(검증: {row['verified_count']}건, 평균품질: {stock_avg_quality:.1f}점, "
+                      f"기간: {str(row['first_date'])[:10]} ~ {str(row['last_date'])[:10]})")
+        
+        # 소스별 신뢰도 (상위 10개)
+        if source_day.empty:
+            source_day = pd.DataFrame(columns=['source', 'date', 'count', 'quality_sum',
+                                               'quality_count', 'verified_count'])
+        sum_columns = ['count', 'quality_sum', 'quality_count', 'verified_count']
+        
+        source_stats = source_day.groupby('source', sort=False, dropna=False)[sum_columns].sum(min_count=1).reset_index()
+        source_stats['avg_quality'] = source_stats['quality_sum'] / source_stats['quality_count'].where(source_stats['quality_count'] > 0)
+        source_stats = source_stats.sort_values(['avg_quality', 'count'], ascending=False, kind='stable').head(10)
+        
         if not source_stats.empty:
             print(f"\n📰 소스별 신뢰도 (상위 10개):")
             for _, row in source_stats.iterrows():
@@ -1050,17 +2269,9 @@ class EnhancedNewsCollector:
                       f"(평균품질: {row['avg_quality']:.1f}점, 검증률: {verification_rate:.1f}%)")
         
         # 일별 뉴스 수 (최근 7일, 품질별)
-        daily_news = self.query_db("""
-            SELECT 
-                DATE(published_date) as date, 
-                COUNT(*) as count,
-                AVG(quality_score) as avg_quality,
-                COUNT(CASE WHEN is_verified = 1 THEN 1 END) as verified_count
-            FROM news_articles
-            WHERE published_date >= DATE('now', '-7 days')
-            GROUP BY DATE(published_date)
-            ORDER BY date DESC
-        """)
+        daily_news = source_day.dropna(subset=['date']).groupby('date')[sum_columns].sum(min_count=1).reset_index()
+        daily_news['avg_quality'] = daily_news['quality_sum'] / daily_news['quality_count'].where(daily_news['quality_count'] > 0)
+        daily_news = daily_news.sort_values('date', ascending=False)
         
         if not daily_news.empty:
             print(f"\n📅 일별 뉴스 (최근 7일):")
@@ -1070,18 +2281,9 @@ class EnhancedNewsCollector:
                       f"(검증: {row['verified_count']}건, 평균품질: {row['avg_quality']:.1f}점)")
         
         # 필터링 통계
-        filter_stats = self.query_db("""
-            SELECT 
-                filter_reason,
-                COUNT(*) as count
-            FROM quality_filter_log
-            GROUP BY filter_reason
-            ORDER BY count DESC
-        """)
-        
-        if not filter_stats.empty:
+        if filter_stats:
             print(f"\n🚫 필터링 통계:")
-            for _, row in filter_stats.iterrows():
+            for row in filter_stats:
                 print(f"   {row['filter_reason']}: {row['count']}건")
         
         print("=" * 50)
@@ -1095,29 +2297,136 @@ class EnhancedNewsSentimentAnalyzer:
     품질 점수를 가중치로 하여 더 정확한 감정 지수를 계산합니다.
     """
     
+    # 감정 분석 시 한 번에 읽어 들이는 행 수
+    SENTIMENT_CHUNK_SIZE = 5000
+    
+    # 분석 대상이 이 건수 이상이면 사전 검색을 프로세스 풀에서 병렬 처리
+    # (적은 건수는 워커 기동/전송 비용이 더 큼)
+    SENTIMENT_PARALLEL_MIN_ROWS = 50_000
+    
     def __init__(self):
         self.data_dir = Path(DATA_DIR)
         self.db_path = self.data_dir / 'news_data.db'
         
-        # 강화된 금융 감정 사전 (한국어)
-        self.positive_words = {
+        # 강화된 금융 감정 사전 (한국어, 변경 불가 집합)
+        self.positive_words = frozenset({
             '상승', '급등', '호재', '성장', '증가', '확대', '개선', '회복',
             '돌파', '상향', '긍정', '호황', '활성', '부양', '투자', '확장',
             '수익', '이익', '실적', '개발', '혁신', '전망', '기대', '추천',
             '매수', '강세', '반등', '선방', '양호', '우수', '탄탄', '견조',
             '흑자', '증익', '호조', '개선', '신고가', '최고', '성공', '우량'
-        }
+        })
         
-        self.negative_words = {
+        self.negative_words = frozenset({
             '하락', '급락', '악재', '감소', '축소', '악화', '침체', '위기',
             '손실', '적자', '부진', '둔화', '경고', '우려', '불안', '리스크',
             '타격', '충격', '압박', '제재', '규제', '파산', '구조조정',
             '매도', '약세', '조정', '부담', '취약', '악순환', '침체', '저조',
             '적자', '감익', '부실', '위험', '신저가', '최저', '실패', '불량'
-        }
+        })
+        
+        self._init_matchers()
+        
+        if self.db_path.exists():
+            with self._connect() as conn:
+                migrate_news_schema(conn)
         
         print("✅ 강화된 뉴스 감정 분석기 초기화 완료")
     
+    def _connect(self):
+        """뉴스 DB 연결 (성능 PRAGMA 적용)"""
+        return connect_news_db(self.db_path)
+    
+    def _read_conn(self):
+        """조회 전용 연결 (스레드별 캐시)"""
+        return get_read_connection(self.db_path)
+    
+    def _build_sentiment_automaton(self):
+        """긍정/부정 사전을 하나의 Aho-Corasick 오토마톤으로 구성"""
+        if ahocorasick is None:
+            return None
+        
+        automaton = ahocorasick.Automaton()
+        for word in self.positive_words:
+            automaton.add_word(word, (1, word))
+        for word in self.negative_words:
+            automaton.add_word(word, (-1, word))
+        automaton.make_automaton()
+        
+        return automaton
+    
+    def _init_matchers(self):
+        """감정 사전 검색기 구성 (프로세스 풀 워커에서도 같은 방식으로 호출)"""
+        # 사전에 대소문자가 있는 문자가 없으면(한글 전용) 텍스트 소문자 변환이 결과에 영향 없음
+        self._needs_lower = any(word.lower() != word.upper()
+                                for word in self.positive_words | self.negative_words)
+        
+        # 긍정/부정 사전을 한 번의 스캔으로 찾는 매처 (Hyperscan 우선, 없으면 Aho-Corasick)
+        self._hyperscan_db, self._hyperscan_tags = self._build_sentiment_hyperscan()
+        self._automaton = self._build_sentiment_automaton() if self._hyperscan_db is None else None
+    
+    def _build_sentiment_hyperscan(self):
+        """
+        긍정/부정 사전을 하나의 Hyperscan 다중 패턴 DB로 컴파일
+        
+        Returns:
+            tuple: (Database 또는 None, 패턴 id → 감정 태그 리스트)
+        """
+        if hyperscan is None:
+            return None, []
+        
+        # 오토마톤과 같은 규칙: 양쪽 사전에 모두 있는 단어는 부정으로 취급
+        word_tags = {word: 1 for word in self.positive_words}
+        word_tags.update((word, -1) for word in self.negative_words)
+        words = list(word_tags)
+        
+        try:
+            database = hyperscan.Database()
+            database.compile(
+                expressions=[re.escape(word).encode('utf-8') for word in words],
+                ids=list(range(len(words))),
+                elements=len(words),
+                # 단어별 등장 여부만 세므로 패턴마다 첫 매칭만 보고
+                flags=[hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_SINGLEMATCH] * len(words)
+            )
+        except Exception as e:
+            logger.debug(f"Hyperscan 감정 사전 컴파일 실패, 오토마톤 사용: {e}")
+            return None, []
+        
+        return database, [word_tags[word] for word in words]
+    
+    def _sentiment_tags(self, text):
+        """텍스트에 등장한 사전 단어별 감정 태그 목록 (+1 긍정 / -1 부정)"""
+        if self._hyperscan_db is not None:
+            matched_ids = set()
+            self._hyperscan_db.scan(
+                text.encode('utf-8'),
+                match_event_handler=lambda pattern_id, start, end, flags, context: matched_ids.add(pattern_id)
+            )
+            return [self._hyperscan_tags[pattern_id] for pattern_id in matched_ids]
+        
+        if self._automaton is None:
+            return ([1 for word in self.positive_words if word in text] +
+                    [-1 for word in self.negative_words if word in text])
+        
+        # 단어별 등장 여부만 세므로 같은 단어의 반복 매칭은 한 번으로 취급
+        return [tag for tag, _ in {value for _, value in self._automaton.iter(text)}]
+    
+    def _count_sentiment_words(self, text):
+        """텍스트에 등장한 (긍정, 부정) 사전 단어 수"""
+        tags = self._sentiment_tags(text)
+        positive_count = sum(1 for tag in tags if tag > 0)
+        
+        return positive_count, len(tags) - positive_count
+    
+    @staticmethod
+    def _count_word_hits(texts, words):
+        """행별로 등장한 사전 단어 수 (단어당 pandas 문자열 검사 1회)"""
+        hits = np.zeros(len(texts), dtype=np.int64)
+        for word in words:
+            hits += texts.str.contains(word, regex=False).to_numpy(dtype=np.int64)
+        return hits
+    
     def calculate_weighted_sentiment_score(self, text, quality_score=100):
         """
         📊 품질 가중치를 적용한 감정 점수 계산
@@ -1132,11 +2441,11 @@ class EnhancedNewsSentimentAnalyzer:
         if not text:
             return 0.0, 'neutral', 0.0
         
-        text = text.lower()
+        if self._needs_lower:
+            text = text.lower()
         
         # 긍정/부정 단어 개수 계산
-        positive_count = sum(1 for word in self.positive_words if word in text)
-        negative_count = sum(1 for word in self.negative_words if word in text)
+        positive_count, negative_count = self._count_sentiment_words(text)
         
         # 총 감정 단어 수
         total_sentiment_words = positive_count + negative_count
@@ -1161,67 +2470,159 @@ class EnhancedNewsSentimentAnalyzer:
         
         return sentiment_score, sentiment_label, weighted_score
     
+    def _score_texts(self, texts):
+        """📊 정규화 텍스트 Series → 기본 감정 점수 배열 (-1.0 ~ 1.0)"""
+        if self._automaton is None and self._hyperscan_db is None:
+            # 오토마톤이 없으면 단어마다 전체 행을 한 번에 검사 (행 x 단어 파이썬 루프 제거)
+            positive = self._count_word_hits(texts, self.positive_words)
+            negative = self._count_word_hits(texts, self.negative_words)
+            total = positive + negative
+            return np.where(total > 0, (positive - negative) / np.maximum(total, 1), 0.0)
+        
+        # 기사별 태그를 하나의 int8 배열로 이어 붙이고 구간 경계(offsets)만 따로 보관
+        tag_runs = [self._sentiment_tags(text) for text in texts]
+        offsets = np.zeros(len(tag_runs) + 1, dtype=np.int64)
+        np.cumsum([len(run) for run in tag_runs], out=offsets[1:])
+        tags = np.fromiter((tag for run in tag_runs for tag in run), dtype=np.int8, count=offsets[-1])
+        return score_sentiment_tags(tags, offsets)
+    
+    def _score_news_frame(self, news_df):
+        """
+        📊 DataFrame 단위 품질가중 감정 점수 계산
+        
+        calculate_weighted_sentiment_score와 같은 규칙을 전체 행에 벡터 연산으로 적용합니다.
+        
+        Returns:
+            tuple: (weighted_score 배열, sentiment_label 배열)
+        """
+        text_codes, unique_texts = self._unique_texts(news_df)
+        sentiment_score = self._score_texts(pd.Series(unique_texts, dtype=object))[text_codes]
+        
+        return self._apply_quality_weight(news_df, sentiment_score)
+    
+    def _unique_texts(self, news_df):
+        """
+        분석할 텍스트를 만들고 고유 텍스트로 묶음
+        
+        Returns:
+            tuple: (행별 고유 텍스트 번호 배열, 고유 텍스트 배열)
+        """
+        # 제목과 요약을 합쳐서 분석 (저장 시 만들어 둔 text_norm이 있으면 그대로 사용)
+        texts = news_df['title'].fillna('') + ' ' + news_df['summary'].fillna('')
+        if self._needs_lower:
+            texts = texts.str.lower()
+        if 'text_norm' in news_df:
+            texts = news_df['text_norm'].fillna(texts)
+        
+        # 같은 기사가 여러 종목에 연결되는 경우가 많으므로 고유 텍스트만 한 번씩 점수화 후 펼침
+        return pd.factorize(texts)
+    
+    @staticmethod
+    def _apply_quality_weight(news_df, sentiment_score):
+        """기본 감정 점수 → (품질 가중 점수 배열, 라벨 배열)"""
+        # 품질 가중치 적용
+        quality_weight = news_df['quality_score'].fillna(0).to_numpy(dtype=float) / 100.0
+        weighted_score = sentiment_score * quality_weight
+        
+        sentiment_label = np.select(
+            [weighted_score > 0.15, weighted_score < -0.15],
+            ['positive', 'negative'],
+            default='neutral'
+        )
+        
+        return weighted_score, sentiment_label
+    
+    def _score_chunks_parallel(self, chunks, worker_count):
+        """
+        ⚡ 청크별 사전 검색을 프로세스 풀에서 병렬 처리
+        
+        워커는 고유 텍스트의 기본 감정 점수만 계산하고, 품질 가중치와 DB 저장은
+        현재 프로세스에서 청크 순서대로 처리합니다. 앞서 보낸 청크가 worker_count * 2개를
+        넘지 않도록 제한해 읽어 둔 청크가 메모리에 쌓이지 않게 합니다.
+        
+        Yields:
+            tuple: (청크 DataFrame, weighted_score 배열, sentiment_label 배열)
+        """
+        with ProcessPoolExecutor(max_workers=worker_count, initializer=_init_sentiment_worker,
+                                 initargs=(self.positive_words, self.negative_words)) as executor:
+            pending = deque()
+            
+            def finish(chunk, text_codes, future):
+                return (chunk, *self._apply_quality_weight(chunk, future.result()[text_codes]))
+            
+            for chunk in chunks:
+                text_codes, unique_texts = self._unique_texts(chunk)
+                pending.append((chunk, text_codes, executor.submit(_score_texts_in_worker, unique_texts)))
+                if len(pending) >= worker_count * 2:
+                    yield finish(*pending.popleft())
+            
+            while pending:
+                yield finish(*pending.popleft())
+    
     def analyze_all_news_sentiment(self):
         """🔍 모든 고품질 뉴스에 대해 감정 분석 수행"""
         print("🔍 강화된 뉴스 감정 분석 시작!")
         
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                # 품질 검증된 뉴스 중 감정 분석이 안된 뉴스들 조회
-                query = """
-                    SELECT id, title, content, summary, stock_code, quality_score
-                    FROM news_articles
+            with self._connect() as conn:
+                read_conn = self._read_conn()
+                # 품질 검증된 뉴스 중 감정 분석이 안된 뉴스 수
+                total_count = conn.execute("""
+                    SELECT COUNT(*) FROM news_articles
                     WHERE sentiment_score IS NULL AND is_verified = 1
-                    ORDER BY quality_score DESC, id
-                """
-                news_to_analyze = pd.read_sql_query(query, conn)
+                """).fetchone()[0]
                 
-                if news_to_analyze.empty:
+                if total_count == 0:
                     print("✅ 모든 고품질 뉴스가 이미 감정 분석 완료되었습니다.")
                     return
                 
-                print(f"📊 감정 분석 대상: {len(news_to_analyze)}건 (검증된 뉴스만)")
+                print(f"📊 감정 분석 대상: {total_count}건 (검증된 뉴스만)")
                 
-                cursor = conn.cursor()
-                analyzed_count = 0
-                
-                # 진행률 표시
-                progress_bar = tqdm(news_to_analyze.iterrows(), 
-                                  total=len(news_to_analyze),
-                                  desc="🔍 품질가중 감정분석",
-                                  unit="뉴스")
+                # 저장 시 정규화해 둔 텍스트를 읽고, 없는 행만 제목/요약 원문을 읽음
+                query = """
+                    SELECT id, text_norm,
+                           CASE WHEN text_norm IS NULL THEN title END AS title,
+                           CASE WHEN text_norm IS NULL THEN summary END AS summary,
+                           quality_score
+                    FROM news_articles
+                    WHERE sentiment_score IS NULL AND is_verified = 1
+                    ORDER BY quality_score DESC, id
+                """
                 
-                for _, row in progress_bar:
-                    try:
-                        # 제목과 요약을 합쳐서 분석
-                        text_to_analyze = f"{row['title']} {row['summary']}"
-                        quality_score = row['quality_score']
-                        
-                        # 품질 가중치 적용 감정 분석 수행
-                        sentiment_score, sentiment_label, weighted_score = self.calculate_weighted_sentiment_score(
-                            text_to_analyze, quality_score
-                        )
+                # 읽기는 조회 전용 연결에서 청크 단위로 스트리밍 (WAL 스냅샷이라 쓰기와 충돌 없음),
+                # 청크마다 점수화 → 일괄 업데이트 → 커밋 (중단되어도 처리분은 보존)
+                analyzed_count = 0
+                cursor = conn.cursor()
+                chunks = pd.read_sql_query(query, read_conn, chunksize=self.SENTIMENT_CHUNK_SIZE)
+                worker_count = os.cpu_count() or 1
+                with tqdm(total=total_count, desc="🔍 품질가중 감정분석", unit="뉴스") as progress_bar:
+                    if worker_count > 1 and total_count >= self.SENTIMENT_PARALLEL_MIN_ROWS:
+                        scored_chunks = self._score_chunks_parallel(chunks, worker_count)
+                    else:
+                        scored_chunks = ((chunk, *self._score_news_frame(chunk)) for chunk in chunks)
+                    
+                    for chunk, weighted_scores, sentiment_labels in scored_chunks:
+                        labels = sentiment_labels.tolist()
+                        updates = list(zip(
+                            weighted_scores.tolist(),
+                            labels,
+                            [SENTIMENT_LABEL_IDS[label] for label in labels],
+                            chunk['id'].tolist()
+                        ))
                         
-                        # DB 업데이트
-                        cursor.execute('''
+                        cursor.execute('BEGIN')
+                        cursor.executemany('''
                             UPDATE news_articles 
-                            SET sentiment_score = ?, sentiment_label = ?
+                            SET sentiment_score = ?, sentiment_label = ?, sentiment_label_id = ?
                             WHERE id = ?
-                        ''', (weighted_score, sentiment_label, row['id']))
-                        
-                        analyzed_count += 1
-                        
-                        progress_bar.set_postfix({
-                            'Analyzed': analyzed_count,
-                            'Current': sentiment_label,
-                            'Quality': f"{quality_score}점"
-                        })
+                        ''', updates)
+                        conn.commit()
                         
-                    except Exception as e:
-                        print(f"\n⚠️ 뉴스 ID {row['id']} 감정 분석 실패: {e}")
-                        continue
+                        analyzed_count += len(updates)
+                        progress_bar.update(len(updates))
                 
-                conn.commit()
+                # 라벨 분포가 크게 바뀌었으므로 필요한 인덱스 통계만 갱신
+                conn.execute('PRAGMA optimize')
                 
                 print(f"\n✅ 강화된 감정 분석 완료: {analyzed_count}건")
                 
@@ -1236,77 +2637,69 @@ class EnhancedNewsSentimentAnalyzer:
         print("📈 강화된 일별 감정 지수 계산 중...")
         
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
-                # 종목별, 일별 감정 분석 결과 집계 (품질 가중치 적용)
-                query = """
+                # 종목별, 일별 집계와 감정 지수 계산/저장을 한 문장으로 처리
+                # 감정 지수 (0~100, 50이 중립):
+                #   기본 지수 = 50 + (긍정비율 - 부정비율) * 50
+                #   품질 가중치(평균 품질/100)와 검증 뉴스 비율을 중립(50) 기준 편차에 곱함
+                # 이미 계산된 (종목, 날짜)는 UPSERT로 제자리 갱신 (REPLACE의 삭제 후 재삽입 방지)
+                cursor.execute('''
+                    INSERT INTO sentiment_analysis
+                    (stock_code, date, positive_count, negative_count, neutral_count,
+                     total_count, sentiment_score, sentiment_index, average_quality, 
+                     verified_news_ratio, created_date)
                     SELECT 
                         stock_code,
-                        DATE(published_date) as date,
-                        SUM(CASE WHEN sentiment_label = 'positive' THEN 1 ELSE 0 END) as positive_count,
-                        SUM(CASE WHEN sentiment_label = 'negative' THEN 1 ELSE 0 END) as negative_count,
-                        SUM(CASE WHEN sentiment_label = 'neutral' THEN 1 ELSE 0 END) as neutral_count,
-                        COUNT(*) as total_count,
-                        AVG(sentiment_score) as avg_sentiment_score,
-                        AVG(quality_score) as avg_quality_score,
-                        COUNT(CASE WHEN is_verified = 1 THEN 1 END) * 1.0 / COUNT(*) as verified_ratio
-                    FROM news_articles
-                    WHERE sentiment_score IS NOT NULL
-                    AND published_date >= DATE('now', '-30 days')
-                    GROUP BY stock_code, DATE(published_date)
-                    ORDER BY stock_code, date
-                """
+                        date,
+                        positive_count,
+                        negative_count,
+                        neutral_count,
+                        total_count,
+                        avg_sentiment_score,
+                        50 + (positive_count - negative_count) * 50.0 / total_count
+                             * (avg_quality_score / 100.0) * verified_ratio,
+                        avg_quality_score,
+                        verified_ratio,
+                        ?
+                    FROM (
+                        SELECT 
+                            stock_code,
+                            DATE(published_date) as date,
+                            SUM(sentiment_label_id = 1) as positive_count,
+                            SUM(sentiment_label_id = -1) as negative_count,
+                            SUM(sentiment_label_id = 0) as neutral_count,
+                            COUNT(*) as total_count,
+                            AVG(sentiment_score) as avg_sentiment_score,
+                            AVG(quality_score) as avg_quality_score,
+                            COUNT(CASE WHEN is_verified = 1 THEN 1 END) * 1.0 / COUNT(*) as verified_ratio
+                        FROM news_articles
+                        WHERE sentiment_score IS NOT NULL
+                        AND published_date >= DATE('now', '-30 days')
+                        GROUP BY stock_code, DATE(published_date)
+                    )
+                    WHERE true
+                    ON CONFLICT(stock_code, date) DO UPDATE SET
+                        positive_count = excluded.positive_count,
+                        negative_count = excluded.negative_count,
+                        neutral_count = excluded.neutral_count,
+                        total_count = excluded.total_count,
+                        sentiment_score = excluded.sentiment_score,
+                        sentiment_index = excluded.sentiment_index,
+                        average_quality = excluded.average_quality,
+                        verified_news_ratio = excluded.verified_news_ratio,
+                        created_date = excluded.created_date
+                ''', (datetime.now().isoformat(),))
                 
-                results = pd.read_sql_query(query, conn)
+                result_count = cursor.rowcount
+                conn.commit()
                 
-                if results.empty:
+                if result_count <= 0:
                     print("❌ 감정 분석 데이터가 없습니다.")
                     return
                 
-                # 강화된 감정 지수 계산 및 저장
-                for _, row in results.iterrows():
-                    # 품질 가중치 적용된 감정 지수 계산 (0~100, 50이 중립)
-                    if row['total_count'] > 0:
-                        positive_ratio = row['positive_count'] / row['total_count']
-                        negative_ratio = row['negative_count'] / row['total_count']
-                        
-                        # 기본 감정 지수
-                        base_sentiment_index = 50 + (positive_ratio - negative_ratio) * 50
-                        
-                        # 품질 가중치 적용
-                        quality_weight = row['avg_quality_score'] / 100.0
-                        enhanced_sentiment_index = 50 + (base_sentiment_index - 50) * quality_weight
-                        
-                        # 검증된 뉴스 비율도 반영
-                        verified_weight = row['verified_ratio']
-                        final_sentiment_index = 50 + (enhanced_sentiment_index - 50) * verified_weight
-                    else:
-                        final_sentiment_index = 50
-                    
-                    # DB에 저장
-                    cursor.execute('''
-                        INSERT OR REPLACE INTO sentiment_analysis
-                        (stock_code, date, positive_count, negative_count, neutral_count,
-                         total_count, sentiment_score, sentiment_index, average_quality, 
-                         verified_news_ratio, created_date)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ''', (
-                        row['stock_code'],
-                        row['date'],
-                        row['positive_count'],
-                        row['negative_count'],
-                        row['neutral_count'],
-                        row['total_count'],
-                        row['avg_sentiment_score'],
-                        final_sentiment_index,
-                        row['avg_quality_score'],
-                        row['verified_ratio'],
-                        datetime.now().isoformat()
-                    ))
-                
-                conn.commit()
-                print(f"✅ {len(results)}건의 강화된 일별 감정 지수 계산 완료")
+                print(f"✅ {result_count}건의 강화된 일별 감정 지수 계산 완료")
                 
         except Exception as e:
             print(f"❌ 강화된 감정 지수 계산 실패: {e}")
@@ -1314,38 +2707,51 @@ class EnhancedNewsSentimentAnalyzer:
     def summarize_enhanced_sentiment_results(self):
         """📊 강화된 감정 분석 결과 요약"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                # 전체 감정 분포 (검증된 뉴스만)
-                sentiment_dist = pd.read_sql_query("""
+            with self._read_conn() as conn:
+                # 검증된 뉴스를 종목 × 감정 라벨로 한 번만 집계하고,
+                # 전체 감정 분포와 종목별 감정 점수는 그 결과에서 계산
+                grouped = pd.read_sql_query("""
                     SELECT 
+                        stock_code,
+                        stock_name,
                         sentiment_label,
                         COUNT(*) as count,
-                        AVG(quality_score) as avg_quality,
-                        COUNT(*) * 100.0 / (SELECT COUNT(*) FROM news_articles WHERE sentiment_label IS NOT NULL AND is_verified = 1) as percentage
+                        SUM(quality_score) as quality_sum,
+                        COUNT(quality_score) as quality_count,
+                        SUM(sentiment_score) as sentiment_sum,
+                        COUNT(sentiment_score) as sentiment_count,
+                        SUM(CASE WHEN sentiment_score IS NOT NULL THEN quality_score END) as scored_quality_sum,
+                        COUNT(CASE WHEN sentiment_score IS NOT NULL THEN quality_score END) as scored_quality_count
                     FROM news_articles
-                    WHERE sentiment_label IS NOT NULL AND is_verified = 1
-                    GROUP BY sentiment_label
+                    WHERE is_verified = 1
+                    AND (sentiment_label IS NOT NULL OR sentiment_score IS NOT NULL)
+                    GROUP BY stock_code, stock_name, sentiment_label
                 """, conn)
                 
+                # 전체 감정 분포 (검증된 뉴스만)
+                labeled = grouped.dropna(subset=['sentiment_label'])
+                sentiment_dist = labeled.groupby('sentiment_label')[['count', 'quality_sum', 'quality_count']].sum().reset_index()
+                sentiment_dist['avg_quality'] = sentiment_dist['quality_sum'] / sentiment_dist['quality_count'].where(sentiment_dist['quality_count'] > 0)
+                sentiment_dist['percentage'] = sentiment_dist['count'] * 100.0 / sentiment_dist['count'].sum()
+                
                 print("\n📊 강화된 감정 분포 (검증된 뉴스만):")
                 for _, row in sentiment_dist.iterrows():
                     print(f"   {row['sentiment_label']}: {row['count']:,}건 ({row['percentage']:.1f}%, 평균품질: {row['avg_quality']:.1f}점)")
                 
                 # 종목별 감정 점수 (상위/하위 5개, 품질 가중치 적용)
-                stock_sentiment = pd.read_sql_query("""
-                    SELECT 
-                        stock_code,
-                        stock_name,
-                        AVG(sentiment_score) as avg_sentiment,
-                        AVG(quality_score) as avg_quality,
-                        COUNT(*) as news_count,
-                        COUNT(CASE WHEN is_verified = 1 THEN 1 END) as verified_count
-                    FROM news_articles
-                    WHERE sentiment_score IS NOT NULL AND is_verified = 1
-                    GROUP BY stock_code, stock_name
-                    HAVING COUNT(*) >= 5
-                    ORDER BY avg_sentiment DESC
-                """, conn)
+                # sentiment_score 가 있는 뉴스만 세기 위해 건수도 sentiment_count 기준으로 합산
+                scored = grouped[grouped['sentiment_count'] > 0]
+                stock_sentiment = scored.groupby(['stock_code', 'stock_name'], dropna=False).agg(
+                    sentiment_sum=('sentiment_sum', 'sum'),
+                    news_count=('sentiment_count', 'sum'),
+                    quality_sum=('scored_quality_sum', 'sum'),
+                    quality_count=('scored_quality_count', 'sum'),
+                ).reset_index()
+                stock_sentiment = stock_sentiment[stock_sentiment['news_count'] >= 5].copy()
+                stock_sentiment['avg_sentiment'] = stock_sentiment['sentiment_sum'] / stock_sentiment['news_count']
+                stock_sentiment['avg_quality'] = stock_sentiment['quality_sum'] / stock_sentiment['quality_count'].where(stock_sentiment['quality_count'] > 0)
+                stock_sentiment['verified_count'] = stock_sentiment['news_count']
+                stock_sentiment = stock_sentiment.sort_values('avg_sentiment', ascending=False, kind='stable')
                 
                 if not stock_sentiment.empty:
                     print(f"\n📈 종목별 평균 감정 점수 (품질 가중치 적용):")
@@ -1365,7 +2771,7 @@ class EnhancedNewsSentimentAnalyzer:
     def get_enhanced_stock_sentiment_trend(self, stock_code, days=30):
         """📈 특정 종목의 강화된 감정 추이 조회"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._read_conn() as conn:
                 query = """
                     SELECT 
                         date, 
@@ -1375,19 +2781,144 @@ class EnhancedNewsSentimentAnalyzer:
                         verified_news_ratio
                     FROM sentiment_analysis
                     WHERE stock_code = ?
-                    AND date >= DATE('now', '-{} days')
+                    AND date >= DATE('now', ?)
                     ORDER BY date
-                """.format(days)
+                """
                 
-                return pd.read_sql_query(query, conn, params=(stock_code,))
+                # 기간은 바인드 변수로 전달 (SQL 문자열이 고정되어 prepared statement 재사용)
+                return pd.read_sql_query(query, conn, params=(stock_code, f'-{int(days)} days'))
                 
         except Exception as e:
             print(f"❌ 강화된 감정 추이 조회 실패: {e}")
             return pd.DataFrame()
 
 
-def main():
-    """메인 실행 함수"""
+# 프로세스 풀 워커별 감정 분석기 (워커 시작 시 한 번만 구성)
+_worker_sentiment_analyzer = None
+
+
+def _init_sentiment_worker(positive_words, negative_words):
+    """프로세스 풀 워커 초기화: DB 연결 없이 감정 사전 검색기만 구성"""
+    global _worker_sentiment_analyzer
+    analyzer = EnhancedNewsSentimentAnalyzer.__new__(EnhancedNewsSentimentAnalyzer)
+    analyzer.positive_words = positive_words
+    analyzer.negative_words = negative_words
+    analyzer._init_matchers()
+    _worker_sentiment_analyzer = analyzer
+
+
+def _score_texts_in_worker(unique_texts):
+    """프로세스 풀 워커에서 고유 텍스트 배열의 기본 감정 점수 계산"""
+    return _worker_sentiment_analyzer._score_texts(pd.Series(unique_texts, dtype=object))
+
+
+@functools.lru_cache(maxsize=1)
+def get_news_collector():
+    """메뉴 간에 재사용하는 뉴스 수집기 (첫 호출 시 한 번만 생성)"""
+    collector = EnhancedNewsCollector()
+    atexit.register(collector.session.close)
+    return collector
+
+
+@functools.lru_cache(maxsize=1)
+def get_sentiment_analyzer():
+    """메뉴 간에 재사용하는 감정 분석기 (첫 호출 시 한 번만 생성)"""
+    return EnhancedNewsSentimentAnalyzer()
+
+
+def collect_single_stock_news(stock_code, stock_name, days=7):
+    """📰 특정 종목 고품질 뉴스 수집 및 저장"""
+    collector = get_news_collector()
+    
+    # 같은 종목을 다시 수집할 수 있도록 이전 실행의 요청 URL 기록 초기화
+    collector.seen_urls.clear()
+    news_list = collector.collect_stock_news(stock_code, stock_name, days)
+    saved_count = collector.save_news_to_db(news_list)
+    
+    if news_list:
+        avg_quality = sum(news.get('quality_score', 0) for news in news_list) / len(news_list)
+        print(f"✅ {saved_count}건의 고품질 뉴스를 수집했습니다. (평균 품질: {avg_quality:.1f}점)")
+    else:
+        print("❌ 품질 기준을 통과한 뉴스가 없습니다.")
+
+
+def print_quality_filter_stats():
+    """🚫 최근 7일 품질 필터링 통계 출력"""
+    collector = get_news_collector()
+    
+    # 필터링 통계 조회
+    filter_stats = collector.fetch_rows("""
+        SELECT 
+            filter_reason,
+            COUNT(*) as count,
+            AVG(quality_score) as avg_quality_score
+        FROM quality_filter_log
+        WHERE filtered_date >= DATE('now', '-7 days')
+        GROUP BY filter_reason
+        ORDER BY count DESC
+    """)
+
+    if filter_stats:
+        print("\n🚫 최근 7일 품질 필터링 통계:")
+        print("=" * 50)
+        for row in filter_stats:
+            print(f"   {row['filter_reason']}: {row['count']:,}건 (평균 점수: {row['avg_quality_score']:.1f}점)")
+
+        # 전체 통계
+        total_filtered = sum(row['count'] for row in filter_stats)
+        total_saved = collector.fetch_rows("""
+            SELECT COUNT(*) as count 
+            FROM news_articles 
+            WHERE collected_date >= DATE('now', '-7 days')
+        """)[0]['count']
+
+        filter_rate = (total_filtered / max(total_filtered + total_saved, 1)) * 100
+        print(f"\n📊 필터링 효과:")
+        print(f"   🚫 필터링된 뉴스: {total_filtered:,}건")
+        print(f"   ✅ 저장된 뉴스: {total_saved:,}건")
+        print(f"   📈 필터링률: {filter_rate:.1f}%")
+    else:
+        print("❌ 최근 필터링 데이터가 없습니다.")
+
+
+def handle_collect_all():
+    """메뉴 1: 전체 종목 고품질 뉴스 수집"""
+    days = int(input("수집할 일수를 입력하세요 (기본값: 7): ").strip() or "7")
+    max_stocks = input("최대 종목 수 (전체: Enter): ").strip()
+    max_stocks = int(max_stocks) if max_stocks else None
+    
+    print(f"\n🛡️ 품질 검증 활성화: 70점 이상만 저장")
+    print(f"🚫 자동 필터링: 스팸/중복/오류 뉴스 제거")
+    
+    get_news_collector().collect_all_stock_news(days=days, max_stocks=max_stocks)
+
+
+def handle_collect_one():
+    """메뉴 2: 특정 종목 뉴스 수집"""
+    stock_code = input("종목코드를 입력하세요 (예: 005930): ").strip()
+    stock_name = input("종목명을 입력하세요 (예: 삼성전자): ").strip()
+    days = int(input("수집할 일수를 입력하세요 (기본값: 7): ").strip() or "7")
+    
+    if stock_code and stock_name:
+        collect_single_stock_news(stock_code, stock_name, days)
+    else:
+        print("❌ 종목코드와 종목명을 모두 입력해주세요.")
+
+
+# 메뉴 번호 → (설명, 실행 함수)
+MENU_HANDLERS = {
+    '1': ("전체 종목 고품질 뉴스 수집", handle_collect_all),
+    '2': ("특정 종목 뉴스 수집", handle_collect_one),
+    '3': ("강화된 뉴스 감정 분석 수행", lambda: get_sentiment_analyzer().analyze_all_news_sentiment()),
+    '4': ("품질 가중치 적용 일별 감정 지수 계산", lambda: get_sentiment_analyzer().calculate_enhanced_daily_sentiment_index()),
+    '5': ("강화된 뉴스 수집 현황 확인", lambda: get_news_collector().get_enhanced_news_summary()),
+    '6': ("품질별 감정 분석 결과 확인", lambda: get_sentiment_analyzer().summarize_enhanced_sentiment_results()),
+    '7': ("품질 필터링 통계 확인", print_quality_filter_stats),
+}
+
+
+def run_interactive_menu():
+    """대화형 메뉴 실행"""
     
     print("🚀 Finance Data Vibe - 강화된 뉴스 수집 및 감정 분석 시스템")
     print("=" * 70)
@@ -1398,114 +2929,74 @@ def main():
     
     while True:
         print("\n📰 원하는 기능을 선택하세요:")
-        print("1. 전체 종목 고품질 뉴스 수집")
-        print("2. 특정 종목 뉴스 수집")
-        print("3. 강화된 뉴스 감정 분석 수행")
-        print("4. 품질 가중치 적용 일별 감정 지수 계산")
-        print("5. 강화된 뉴스 수집 현황 확인")
-        print("6. 품질별 감정 분석 결과 확인")
-        print("7. 품질 필터링 통계 확인")
+        for number, (label, _) in MENU_HANDLERS.items():
+            print(f"{number}. {label}")
         print("0. 종료")
         
-        choice = input("\n선택하세요 (0-7): ").strip()
+        choice = input(f"\n선택하세요 (0-{len(MENU_HANDLERS)}): ").strip()
         
         if choice == '0':
             print("👋 프로그램을 종료합니다.")
             break
         
-        elif choice == '1':
-            # 전체 종목 고품질 뉴스 수집
-            collector = EnhancedNewsCollector()
-            
-            days = int(input("수집할 일수를 입력하세요 (기본값: 7): ").strip() or "7")
-            max_stocks = input("최대 종목 수 (전체: Enter): ").strip()
-            max_stocks = int(max_stocks) if max_stocks else None
-            
-            print(f"\n🛡️ 품질 검증 활성화: 70점 이상만 저장")
-            print(f"🚫 자동 필터링: 스팸/중복/오류 뉴스 제거")
-            
-            collector.collect_all_stock_news(days=days, max_stocks=max_stocks)
-        
-        elif choice == '2':
-            # 특정 종목 뉴스 수집
-            collector = EnhancedNewsCollector()
-            
-            stock_code = input("종목코드를 입력하세요 (예: 005930): ").strip()
-            stock_name = input("종목명을 입력하세요 (예: 삼성전자): ").strip()
-            days = int(input("수집할 일수를 입력하세요 (기본값: 7): ").strip() or "7")
-            
-            if stock_code and stock_name:
-                news_list = collector.collect_naver_finance_news(stock_code, stock_name, days)
-                saved_count = collector.save_news_to_db(news_list)
-                
-                if news_list:
-                    avg_quality = sum(news.get('quality_score', 0) for news in news_list) / len(news_list)
-                    print(f"✅ {saved_count}건의 고품질 뉴스를 수집했습니다. (평균 품질: {avg_quality:.1f}점)")
-                else:
-                    print("❌ 품질 기준을 통과한 뉴스가 없습니다.")
-            else:
-                print("❌ 종목코드와 종목명을 모두 입력해주세요.")
-        
-        elif choice == '3':
-            # 강화된 뉴스 감정 분석
-            analyzer = EnhancedNewsSentimentAnalyzer()
-            analyzer.analyze_all_news_sentiment()
-        
-        elif choice == '4':
-            # 품질 가중치 적용 일별 감정 지수 계산
-            analyzer = EnhancedNewsSentimentAnalyzer()
-            analyzer.calculate_enhanced_daily_sentiment_index()
-        
-        elif choice == '5':
-            # 강화된 뉴스 수집 현황
-            collector = EnhancedNewsCollector()
-            collector.get_enhanced_news_summary()
-        
-        elif choice == '6':
-            # 품질별 감정 분석 결과
-            analyzer = EnhancedNewsSentimentAnalyzer()
-            analyzer.summarize_enhanced_sentiment_results()
-        
-        elif choice == '7':
-            # 품질 필터링 통계
-            collector = EnhancedNewsCollector()
-            
-            # 필터링 통계 조회
-            filter_stats = collector.query_db("""
-                SELECT 
-                    filter_reason,
-                    COUNT(*) as count,
-                    AVG(quality_score) as avg_quality_score
-                FROM quality_filter_log
-                WHERE DATE(filtered_date) >= DATE('now', '-7 days')
-                GROUP BY filter_reason
-                ORDER BY count DESC
-            """)
-            
-            if not filter_stats.empty:
-                print("\n🚫 최근 7일 품질 필터링 통계:")
-                print("=" * 50)
-                for _, row in filter_stats.iterrows():
-                    print(f"   {row['filter_reason']}: {row['count']:,}건 (평균 점수: {row['avg_quality_score']:.1f}점)")
-                
-                # 전체 통계
-                total_filtered = filter_stats['count'].sum()
-                total_saved = collector.query_db("""
-                    SELECT COUNT(*) as count 
-                    FROM news_articles 
-                    WHERE DATE(collected_date) >= DATE('now', '-7 days')
-                """).iloc[0]['count']
-                
-                filter_rate = (total_filtered / max(total_filtered + total_saved, 1)) * 100
-                print(f"\n📊 필터링 효과:")
-                print(f"   🚫 필터링된 뉴스: {total_filtered:,}건")
-                print(f"   ✅ 저장된 뉴스: {total_saved:,}건")
-                print(f"   📈 필터링률: {filter_rate:.1f}%")
-            else:
-                print("❌ 최근 필터링 데이터가 없습니다.")
-        
-        else:
+        if choice not in MENU_HANDLERS:
             print("❌ 올바른 번호를 선택해주세요.")
+            continue
+        
+        _, handler = MENU_HANDLERS[choice]
+        handler()
+
+
+def build_arg_parser():
+    """명령행 인자 파서 (하위 명령 없이 실행하면 대화형 메뉴)"""
+    parser = argparse.ArgumentParser(description="Finance Data Vibe - 강화된 뉴스 수집 및 감정 분석")
+    subparsers = parser.add_subparsers(dest='command')
+    
+    collect_all = subparsers.add_parser('collect-all', help='전체 종목 고품질 뉴스 수집')
+    collect_all.add_argument('--days', type=int, default=7, help='수집할 일수 (기본값: 7)')
+    collect_all.add_argument('--max-stocks', type=int, default=None, help='최대 종목 수 (기본값: 전체)')
+    collect_all.add_argument('--workers', type=int, default=3, help='동시 처리 수 (기본값: 3)')
+    collect_all.add_argument('-y', '--yes', action='store_true', help='확인 없이 바로 수집')
+    
+    collect_one = subparsers.add_parser('collect-one', help='특정 종목 뉴스 수집')
+    collect_one.add_argument('stock_code', help='종목코드 (예: 005930)')
+    collect_one.add_argument('stock_name', help='종목명 (예: 삼성전자)')
+    collect_one.add_argument('--days', type=int, default=7, help='수집할 일수 (기본값: 7)')
+    
+    subparsers.add_parser('analyze', help='강화된 뉴스 감정 분석 수행')
+    subparsers.add_parser('daily-index', help='품질 가중치 적용 일별 감정 지수 계산')
+    subparsers.add_parser('summary', help='강화된 뉴스 수집 현황 확인')
+    subparsers.add_parser('sentiment-summary', help='품질별 감정 분석 결과 확인')
+    subparsers.add_parser('filter-stats', help='품질 필터링 통계 확인')
+    subparsers.add_parser('menu', help='대화형 메뉴 실행')
+    
+    return parser
+
+
+# 하위 명령 → 실행 함수
+CLI_COMMANDS = {
+    'collect-all': lambda args: get_news_collector().collect_all_stock_news(
+        days=args.days, max_stocks=args.max_stocks, max_workers=args.workers, confirm=not args.yes
+    ),
+    'collect-one': lambda args: collect_single_stock_news(args.stock_code, args.stock_name, args.days),
+    'analyze': lambda args: get_sentiment_analyzer().analyze_all_news_sentiment(),
+    'daily-index': lambda args: get_sentiment_analyzer().calculate_enhanced_daily_sentiment_index(),
+    'summary': lambda args: get_news_collector().get_enhanced_news_summary(),
+    'sentiment-summary': lambda args: get_sentiment_analyzer().summarize_enhanced_sentiment_results(),
+    'filter-stats': lambda args: print_quality_filter_stats(),
+    'menu': lambda args: run_interactive_menu(),
+}
+
+
+def main(argv=None):
+    """
+    메인 실행 함수
+    
+    예) python 05_news_collection.py collect-all --days 3 --yes
+        python 05_news_collection.py analyze
+    """
+    args = build_arg_parser().parse_args(argv)
+    CLI_COMMANDS[args.command or 'menu'](args)
 
 
 if __name__ == "__main__":
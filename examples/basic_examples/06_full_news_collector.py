@@ -24,6 +24,9 @@ from dotenv import load_dotenv
 load_dotenv(project_root / '.env')
 
 import requests
+from requests.adapters import HTTPAdapter
+from requests.compat import chardet
+from urllib3.util.retry import Retry
 import sqlite3
 import pandas as pd
 import time
@@ -31,15 +34,37 @@ from datetime import datetime, timedelta
 import logging
 from typing import List, Dict, Optional, Tuple
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 import json
 import re
-from bs4 import BeautifulSoup
+import asyncio
+import functools
+from bs4 import BeautifulSoup, SoupStrainer
 from tqdm import tqdm
 import threading
 import difflib
 from collections import Counter
 import unicodedata
 
+try:
+    import aiohttp
+except ImportError:
+    # aiohttp가 없으면 스레드 기반으로 본문 수집
+    aiohttp = None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    # selectolax가 없으면 BeautifulSoup으로 본문 추출
+    LexborHTMLParser = None
+
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    # lxml이 없으면 BeautifulSoup 내장 파서 사용
+    HTML_PARSER = 'html.parser'
+
 # 로깅 설정 (한글 인코딩 완전 해결)
 logging.basicConfig(
     level=logging.INFO,
@@ -51,6 +76,63 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# SQLite 성능 설정 (WAL + 완화된 동기화 + 임시 데이터 메모리 사용)
+SQLITE_PRAGMAS = """
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+"""
+
+def connect_news_db(db_path, **connect_kwargs):
+    """🗄️ 성능 PRAGMA가 적용된 뉴스 DB 연결 생성 (connect_kwargs는 sqlite3.connect에 전달)"""
+    conn = sqlite3.connect(db_path, **connect_kwargs)
+    conn.executescript(SQLITE_PRAGMAS)
+    return conn
+
+# 광고/관련기사 영역 class 정규식 (모듈 로드 시 한 번만 컴파일)
+AD_CLASS_RE = re.compile(r'(ad|advertisement|related|recommend)')
+
+# 본문 정제용 정규식 (_advanced_text_cleaning)
+# 태그를 지운 자리는 공백이 되어 엔티티를 새로 만들 수 없으므로 태그/엔티티 제거를 한 번에 처리
+HTML_MARKUP_RE = re.compile(r'<[^>]+>|&[a-zA-Z0-9#]+;')
+BOILERPLATE_RES = tuple(re.compile(pattern, re.IGNORECASE | re.DOTALL) for pattern in (
+    r'// flash 오류를 우회하기 위한 함수 추가.*',
+    r'본\s*기사는.*?입니다',
+    r'저작권자.*?무단.*?금지',
+    r'ⓒ.*?무단.*?금지',
+    r'Copyright.*?All.*?rights.*?reserved',
+    r'기자\s*=.*?기자',
+    r'^\s*\[.*?\]\s*',
+    r'\s*\[.*?\]\s*$',
+    r'이\s*메일.*?보내기',
+    r'카카오톡.*?공유',
+    r'페이스북.*?공유',
+    r'트위터.*?공유',
+    r'무단전재.*?금지',
+    r'네이버.*?블로그',
+    r'관련.*?뉴스',
+    r'이전.*?기사',
+    r'다음.*?기사',
+    # '.*?구독.*?알림', '.*?팔로우.*?'와 같은 결과 (문서 처음부터 마지막 일치 위치까지 제거)
+    # 선두 .*?는 시작 위치마다 문서 끝까지 재탐색하므로 문서 시작에 고정
+    r'\A(?:.*?구독.*?알림)+',
+    r'\A.*팔로우',
+    r'광고.*?문의',
+    r'제보.*?tip'
+))
+SPECIAL_CHAR_RE = re.compile(r'[&\[\]{}()\*\+\?\|\^\$\\.~`!@#%=:;",<>]')
+# 숫자→한글, 한글→숫자 경계마다 공백 삽입 (두 번의 치환과 같은 결과)
+DIGIT_HANGUL_BOUNDARY_RE = re.compile(r'(?<=\d)(?=[가-힣])|(?<=[가-힣])(?=\d)')
+REPEATED_WORD_RE = re.compile(r'([가-힣A-Za-z0-9]{2,})\1+')
+REPEATING_PATTERN_RES = tuple(re.compile(f'(.{{{length}}})(\\1)+') for length in range(3, 15))
+WHITESPACE_RE = re.compile(r'\s+')
+
+# 검색 API 결과 정리/종목 관련성 판단용 정규식
+HTML_TAG_RE = re.compile(r'<[^>]+>')
+STOCK_KEYWORD_RE = re.compile('|'.join(map(re.escape, [
+    '주가', '실적', '재무', '매출', '영업이익', '투자', '상장', '공시', '배당'
+])))
+
 class NewsQualityValidator:
     """
     뉴스 품질 검증 시스템
@@ -302,9 +384,16 @@ class BusinessDayCalculator:
     
     @staticmethod
     def get_recent_news_days(days_count: int = 4) -> List[str]:
-        """최근 뉴스 수집 대상일 계산 (평일 + 주말 포함)"""
+        """최근 뉴스 수집 대상일 계산 (평일 + 주말 포함, 같은 날에는 계산 결과 재사용)"""
+        today = datetime.now().strftime('%Y-%m-%d')
+        return list(BusinessDayCalculator._recent_news_days(days_count, today))
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=4)
+    def _recent_news_days(days_count: int, today: str) -> Tuple[str, ...]:
+        """today 기준 최근 뉴스 수집 대상일 (날짜가 바뀌면 캐시 키가 달라져 다시 계산)"""
         news_days = []
-        current_date = datetime.now()
+        current_date = datetime.strptime(today, '%Y-%m-%d')
         
         days_checked = 0
         while len(news_days) < days_count and days_checked < 10:
@@ -315,7 +404,38 @@ class BusinessDayCalculator:
             news_days.append(current_date.strftime('%Y-%m-%d'))
                 
         logger.info(f"[뉴스수집일] 최근 {days_count}일: {', '.join(news_days)}")
-        return news_days
+        return tuple(news_days)
+
+class TokenBucket:
+    """
+    스레드 안전 토큰 버킷 요청 속도 제한기
+    
+    초당 rate개의 토큰을 채우고 요청 전 acquire()로 토큰을 하나씩 소비합니다.
+    여러 스레드가 같은 버킷을 공유하면 전체 요청 속도가 rate 이하로 유지됩니다.
+    """
+    
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity or rate
+        self.tokens = self.capacity
+        self.last_refill = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def acquire(self):
+        """토큰 하나를 얻을 때까지 대기 (대기는 락 밖에서 수행)"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+                self.last_refill = now
+                
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                
+                wait_time = (1 - self.tokens) / self.rate
+            
+            time.sleep(wait_time)
 
 class NewsAPIManager:
     """네이버 뉴스 API 관리자"""
@@ -330,31 +450,36 @@ class NewsAPIManager:
             'User-Agent': 'FinanceDataVibe/1.0'
         }
         
+        # 검색 API 호출 간 keep-alive 연결 재사용 (호출마다 TCP/TLS 연결을 새로 맺지 않도록)
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=64,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
         # API 호출 제한 관리
         self.api_calls_today = 0
         self.max_calls_per_day = 23000  # 여유분 2000회
-        self.last_call_time = time.time()
-        self.min_interval = 0.12  # 초당 8회 제한 (안전하게)
+        # 초당 8회 제한 (안전하게), 순간 허용량 2 → 어느 1초 구간에서도 최대 10회 (네이버 API 초당 10회 제한 이내)
+        self.rate_limiter = TokenBucket(rate=8, capacity=2)
         self.lock = threading.Lock()
         
     def rate_limit_check(self) -> bool:
         """API 호출 제한 확인"""
         with self.lock:
-            current_time = time.time()
-            
             if self.api_calls_today >= self.max_calls_per_day:
                 logger.warning(f"⚠️ 일일 API 호출 제한 도달: {self.api_calls_today:,}")
                 return False
             
-            time_since_last_call = current_time - self.last_call_time
-            if time_since_last_call < self.min_interval:
-                sleep_time = self.min_interval - time_since_last_call
-                time.sleep(sleep_time)
-            
-            self.last_call_time = time.time()
             self.api_calls_today += 1
-            
-            return True
+        
+        # 호출 간격 대기는 락 밖에서 (한 스레드가 기다리는 동안 다른 스레드는 남은 토큰으로 바로 호출)
+        self.rate_limiter.acquire()
+        return True
     
     def search_news(self, query: str, display: int = 100, sort: str = 'date') -> List[Dict]:
         """뉴스 검색"""
@@ -368,7 +493,7 @@ class NewsAPIManager:
         }
         
         try:
-            response = requests.get(self.base_url, headers=self.headers, params=params, timeout=10)
+            response = self.session.get(self.base_url, params=params, timeout=10)
             response.raise_for_status()
             
             data = response.json()
@@ -413,9 +538,57 @@ class NewsAPIManager:
         except:
             return None
 
+def _selector_to_find_args(selector: str) -> Tuple[str, Dict[str, str]]:
+    """'tag#id' / 'tag.class' / 'tag' 형태의 단순 CSS 선택자를 soup.find() 인자로 변환"""
+    if '#' in selector:
+        name, value = selector.split('#', 1)
+        return name, {'id': value}
+    if '.' in selector:
+        name, value = selector.split('.', 1)
+        return name, {'class': value}
+    return selector, {}
+
 class EnhancedNewsContentExtractor:
     """강화된 뉴스 본문 추출기 (품질 검증 통합)"""
     
+    # 네이버 뉴스 본문 선택자 (우선순위 순)
+    NAVER_CONTENT_SELECTORS = (
+        'div#newsct_article',
+        'div.newsct_article', 
+        'div#articleBodyContents',
+        'div.article_body',
+        'div.news_end',
+        'div._article_body_contents'
+    )
+    
+    # 일반 뉴스 사이트 본문 선택자 (우선순위 순)
+    GENERAL_CONTENT_SELECTORS = (
+        'div.article-content',
+        'div.news-content',
+        'div.content',
+        'article',
+        'div.post-content',
+        'div.article_txt',
+        'div.article-body',
+        'div.news-article-content',
+        'div.article-view-content'
+    )
+    
+    # BeautifulSoup 경로용 find() 인자 (CSS 선택자 컴파일 없이 태그/id/class로 바로 검색)
+    NAVER_CONTENT_FINDS = tuple(_selector_to_find_args(s) for s in NAVER_CONTENT_SELECTORS)
+    GENERAL_CONTENT_FINDS = tuple(_selector_to_find_args(s) for s in GENERAL_CONTENT_SELECTORS)
+    
+    # 본문에서 제거할 태그
+    NAVER_UNWANTED_TAGS = ['script', 'style', 'ins', 'iframe', 'aside', 'nav', 'footer']
+    GENERAL_UNWANTED_TAGS = ['script', 'style', 'ins', 'iframe', 'nav', 'footer']
+    
+    # 광고/관련기사 영역 (class에 해당 문자열 포함, AD_CLASS_RE와 같은 조건)
+    AD_CLASS_CSS = '[class*="ad"], [class*="related"], [class*="recommend"]'
+    
+    # BeautifulSoup 경로에서 트리로 만들 태그 (본문 후보 컨테이너 + 마지막 시도용 p 태그)
+    # 후보 태그의 하위 트리는 통째로 유지되므로 선택자 결과는 전체 파싱과 같음
+    CONTENT_STRAINER = SoupStrainer(['div', 'article', 'p'])
+    
     def __init__(self):
         self.session = requests.Session()
         self.session.headers.update({
@@ -427,6 +600,11 @@ class EnhancedNewsContentExtractor:
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1'
         })
+        
+        # 언론사(호스트)별 연결 풀 보관 수 확대 (기본 10개 → 여러 언론사를 오가도 풀이 밀려나지 않도록)
+        adapter = HTTPAdapter(pool_connections=64, pool_maxsize=10)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
     
     def extract_content(self, url: str) -> str:
         """뉴스 기사 본문 추출 (강화된 정제 기능)"""
@@ -437,7 +615,60 @@ class EnhancedNewsContentExtractor:
             # 인코딩 자동 감지 및 설정
             response.encoding = response.apparent_encoding
             
-            soup = BeautifulSoup(response.text, 'html.parser', from_encoding='utf-8')
+            return self._parse_content(response.text, url)
+            
+        except Exception as e:
+            logger.debug(f"본문 추출 실패 - {url}: {e}")
+            return ""
+    
+    def async_session(self, limit: int):
+        """aiohttp 세션 생성 (requests 세션과 같은 헤더 사용)"""
+        # 전체 연결 수 상한 + 언론사별 동시 연결 제한 + DNS 조회 결과 캐시
+        connector = aiohttp.TCPConnector(limit=limit, limit_per_host=4, ttl_dns_cache=300)
+        
+        # Accept-Encoding은 aiohttp가 자신이 해제할 수 있는 방식으로 직접 설정
+        headers = {k: v for k, v in self.session.headers.items() if k.lower() != 'accept-encoding'}
+        return aiohttp.ClientSession(headers=headers, connector=connector)
+    
+    async def extract_content_async(self, session, url: str) -> Optional[str]:
+        """
+        뉴스 기사 본문 비동기 추출 (공유 aiohttp 세션 사용, 파싱은 스레드에서 실행)
+        
+        요청 자체가 실패하면 None, 받은 페이지에서 본문을 찾지 못하면 빈 문자열을 반환합니다.
+        """
+        # 연결/읽기 타임아웃만 적용 (total은 limit_per_host에 막혀 빈 연결을 기다리는 시간까지 포함)
+        timeout = aiohttp.ClientTimeout(total=None, sock_connect=15, sock_read=15)
+        try:
+            async with session.get(url, timeout=timeout) as response:
+                response.raise_for_status()
+                body = await response.read()
+        except Exception as e:
+            logger.debug(f"본문 요청 실패 - {url}: {e}")
+            return None
+        
+        try:
+            # 인코딩 추정/파싱은 CPU 작업이므로 이벤트 루프를 막지 않도록 스레드에서 실행
+            return await asyncio.to_thread(self._parse_content_bytes, body, url)
+        except Exception as e:
+            logger.debug(f"본문 추출 실패 - {url}: {e}")
+            return ""
+    
+    def _parse_content_bytes(self, body: bytes, url: str) -> str:
+        """응답 bytes 디코딩 후 본문 추출 (requests의 apparent_encoding과 같은 인코딩 추정)"""
+        encoding = chardet.detect(body)['encoding'] or 'utf-8'
+        try:
+            html = str(body, encoding, errors='replace')
+        except LookupError:
+            html = str(body, 'utf-8', errors='replace')
+        return self._parse_content(html, url)
+    
+    def _parse_content(self, html: str, url: str) -> str:
+        """HTML 문자열에서 본문 추출 및 정제"""
+        if LexborHTMLParser is not None:
+            # C 기반 lexbor 파서 + CSS 엔진으로 본문 추출
+            content = self._extract_content_lexbor(LexborHTMLParser(html), url)
+        else:
+            soup = BeautifulSoup(html, HTML_PARSER, parse_only=self.CONTENT_STRAINER)
             content = ""
             
             # 네이버 뉴스 본문 추출
@@ -447,36 +678,77 @@ class EnhancedNewsContentExtractor:
             # 다른 뉴스 사이트 본문 추출
             if not content:
                 content = self._extract_general_content(soup)
+        
+        # 강화된 텍스트 정제
+        content = self._advanced_text_cleaning(content)
+        
+        return content[:3000] if content else ""
+    
+    def _extract_content_lexbor(self, tree, url: str) -> str:
+        """selectolax(lexbor) 트리에서 본문 추출 (BeautifulSoup 경로와 같은 선택자/규칙)"""
+        # 네이버 뉴스 본문 추출
+        if 'news.naver.com' in url:
+            for selector in self.NAVER_CONTENT_SELECTORS:
+                content_div = tree.css_first(selector)
+                if content_div:
+                    # 불필요한 요소 및 광고, 관련기사 등 제거
+                    content_div.strip_tags(self.NAVER_UNWANTED_TAGS)
+                    self._decompose_descendants(content_div, self.AD_CLASS_CSS)
+                    
+                    text = content_div.text(separator=' ', strip=True, skip_empty=True)
+                    if len(text) > 100:
+                        return text
+        
+        # 다른 뉴스 사이트 본문 추출
+        for selector in self.GENERAL_CONTENT_SELECTORS:
+            content = tree.css_first(selector)
+            if content:
+                content.strip_tags(self.GENERAL_UNWANTED_TAGS)
+                
+                text = content.text(separator=' ', strip=True, skip_empty=True)
+                if len(text) > 100:
+                    return text
+        
+        # 마지막 시도: 모든 p 태그
+        paragraphs = tree.css('p')
+        if paragraphs:
+            text = ' '.join([p.text(strip=True) for p in paragraphs])
+            if len(text) > 100:
+                return text
+        
+        return ""
+    
+    @staticmethod
+    def _decompose_descendants(root, selector: str) -> None:
+        """
+        root 하위에서 선택자에 맞는 요소 제거 (BeautifulSoup find_all과 같이 root 자신은 제외)
+        
+        이미 제거된 요소의 하위 요소는 다시 건드리지 않습니다.
+        """
+        removed = set()
+        for node in root.css(selector):
+            if node.mem_id == root.mem_id:
+                continue
             
-            # 강화된 텍스트 정제
-            content = self._advanced_text_cleaning(content)
-            
-            return content[:3000] if content else ""
-            
-        except Exception as e:
-            logger.debug(f"본문 추출 실패 - {url}: {e}")
-            return ""
+            # 조상을 따라 올라가 root에 닿으면 아직 트리에 붙어 있는 요소
+            parent = node.parent
+            while parent is not None and parent.mem_id != root.mem_id and parent.mem_id not in removed:
+                parent = parent.parent
+            if parent is not None and parent.mem_id == root.mem_id:
+                removed.add(node.mem_id)
+                node.decompose()
     
     def _extract_naver_content(self, soup: BeautifulSoup) -> str:
         """네이버 뉴스 본문 추출"""
-        selectors = [
-            'div#newsct_article',
-            'div.newsct_article', 
-            'div#articleBodyContents',
-            'div.article_body',
-            'div.news_end',
-            'div._article_body_contents'
-        ]
-        
-        for selector in selectors:
-            content_div = soup.select_one(selector)
+        for name, attrs in self.NAVER_CONTENT_FINDS:
+            content_div = soup.find(name, attrs=attrs)
             if content_div:
                 # 불필요한 요소 제거
-                for elem in content_div.find_all(['script', 'style', 'ins', 'iframe', 'aside', 'nav', 'footer']):
+                for elem in content_div.find_all(self.NAVER_UNWANTED_TAGS):
                     elem.decompose()
                 
                 # 광고, 관련기사 등 제거
-                for elem in content_div.find_all(class_=re.compile(r'(ad|advertisement|related|recommend)')):
+                for elem in content_div.find_all(class_=AD_CLASS_RE):
                     elem.decompose()
                 
                 text = content_div.get_text(separator=' ', strip=True)
@@ -488,22 +760,10 @@ class EnhancedNewsContentExtractor:
     
     def _extract_general_content(self, soup: BeautifulSoup) -> str:
         """일반 뉴스 사이트 본문 추출"""
-        selectors = [
-            'div.article-content',
-            'div.news-content',
-            'div.content',
-            'article',
-            'div.post-content',
-            'div.article_txt',
-            'div.article-body',
-            'div.news-article-content',
-            'div.article-view-content'
-        ]
-        
-        for selector in selectors:
-            content = soup.select_one(selector)
+        for name, attrs in self.GENERAL_CONTENT_FINDS:
+            content = soup.find(name, attrs=attrs)
             if content:
-                for elem in content.find_all(['script', 'style', 'ins', 'iframe', 'nav', 'footer']):
+                for elem in content.find_all(self.GENERAL_UNWANTED_TAGS):
                     elem.decompose()
                 
                 text = content.get_text(separator=' ', strip=True)
@@ -530,43 +790,17 @@ class EnhancedNewsContentExtractor:
         text = unicodedata.normalize('NFKC', text)
         
         # 2. HTML 태그 및 엔티티 제거
-        text = re.sub(r'<[^>]+>', ' ', text)
-        text = re.sub(r'&[a-zA-Z0-9#]+;', ' ', text)
+        text = HTML_MARKUP_RE.sub(' ', text)
         
         # 3. 불필요한 문구 제거 (강화)
-        patterns_to_remove = [
-            r'// flash 오류를 우회하기 위한 함수 추가.*',
-            r'본\s*기사는.*?입니다',
-            r'저작권자.*?무단.*?금지',
-            r'ⓒ.*?무단.*?금지',
-            r'Copyright.*?All.*?rights.*?reserved',
-            r'기자\s*=.*?기자',
-            r'^\s*\[.*?\]\s*',
-            r'\s*\[.*?\]\s*$',
-            r'이\s*메일.*?보내기',
-            r'카카오톡.*?공유',
-            r'페이스북.*?공유',
-            r'트위터.*?공유',
-            r'무단전재.*?금지',
-            r'네이버.*?블로그',
-            r'관련.*?뉴스',
-            r'이전.*?기사',
-            r'다음.*?기사',
-            r'.*?구독.*?알림',
-            r'.*?팔로우.*?',
-            r'광고.*?문의',
-            r'제보.*?tip'
-        ]
-        
-        for pattern in patterns_to_remove:
-            text = re.sub(pattern, '', text, flags=re.IGNORECASE | re.DOTALL)
+        for pattern in BOILERPLATE_RES:
+            text = pattern.sub('', text)
         
         # 4. 특수 문자 정리
-        text = re.sub(r'[&\[\]{}()\*\+\?\|\^\$\\.~`!@#%=:;",<>]', ' ', text)
+        text = SPECIAL_CHAR_RE.sub(' ', text)
         
         # 5. 숫자와 한글 사이 공백
-        text = re.sub(r'(\d)([가-힣])', r'\1 \2', text)
-        text = re.sub(r'([가-힣])(\d)', r'\1 \2', text)
+        text = DIGIT_HANGUL_BOUNDARY_RE.sub(' ', text)
         
         # 6. 중복 제거 (핵심 개선!)
         words = text.split()
@@ -582,19 +816,14 @@ class EnhancedNewsContentExtractor:
         text = ' '.join(cleaned_words)
         
         # 7. 중복 패턴 제거 (정규표현식)
-        text = re.sub(r'([가-힣A-Za-z0-9]{2,})\1+', r'\1', text)
+        text = REPEATED_WORD_RE.sub(r'\1', text)
         
         # 8. 반복 구문 제거
-        def remove_repeating_patterns(text):
-            for length in range(3, 15):
-                pattern = f'(.{{{length}}})(\\1)+'
-                text = re.sub(pattern, r'\1', text)
-            return text
-        
-        text = remove_repeating_patterns(text)
+        for pattern in REPEATING_PATTERN_RES:
+            text = pattern.sub(r'\1', text)
         
         # 9. 여러 공백을 하나로
-        text = re.sub(r'\s+', ' ', text)
+        text = WHITESPACE_RE.sub(' ', text)
         
         # 10. 최종 정리
         text = text.strip()
@@ -604,6 +833,9 @@ class EnhancedNewsContentExtractor:
 class StockNewsCollector:
     """주식 뉴스 수집기 메인 클래스 (품질 검증 통합)"""
     
+    # 본문 수집용 aiohttp 동시 연결 수 상한 (언론사별로는 4개까지)
+    ASYNC_CONNECTION_LIMIT = 100
+    
     def __init__(self, client_id: str, client_secret: str):
         self.api_manager = NewsAPIManager(client_id, client_secret)
         self.content_extractor = EnhancedNewsContentExtractor()
@@ -611,6 +843,15 @@ class StockNewsCollector:
         self.db_path = project_root / "finance_data.db"
         self.init_database()
         
+        # 수집기 전체에서 재사용하는 DB 연결 (스레드 간 공유, 사용은 _db_lock으로 직렬화)
+        # isolation_level=None: 쓰기는 _transaction()에서 BEGIN/COMMIT으로 직접 묶음
+        self._conn = connect_news_db(self.db_path, check_same_thread=False, isolation_level=None)
+        self._db_lock = threading.Lock()
+        
+        # 전체 수집 중 종목 간에 공유하는 기존/수집 링크 (종목마다 DB를 다시 조회하지 않도록)
+        self._existing_links = None
+        self._existing_links_lock = threading.Lock()
+        
         # 품질 통계
         self.quality_stats = {
             'total_processed': 0,
@@ -623,7 +864,7 @@ class StockNewsCollector:
     
     def init_database(self):
         """데이터베이스 테이블 초기화 (안전한 업그레이드 포함)"""
-        with sqlite3.connect(self.db_path) as conn:
+        with connect_news_db(self.db_path) as conn:
             cursor = conn.cursor()
             
             # 기존 테이블 확인
@@ -746,9 +987,28 @@ class StockNewsCollector:
             conn.commit()
             logger.info("데이터베이스 초기화/업그레이드 완료")
     
+    @contextmanager
+    def _transaction(self):
+        """🔒 공유 연결에서 쓰기 트랜잭션 실행 (정상 종료 시 COMMIT, 예외 시 ROLLBACK)"""
+        with self._db_lock:
+            self._conn.execute('BEGIN')
+            try:
+                yield self._conn
+            except BaseException:
+                if self._conn.in_transaction:
+                    self._conn.execute('ROLLBACK')
+                raise
+            else:
+                self._conn.execute('COMMIT')
+    
+    def close(self):
+        """공유 DB 연결 종료"""
+        with self._db_lock:
+            self._conn.close()
+    
     def get_all_stocks(self) -> List[Dict[str, str]]:
         """전체 주식 종목 조회"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._db_lock:
             df = pd.read_sql_query("""
                 SELECT code, name 
                 FROM stock_info 
@@ -756,7 +1016,7 @@ class StockNewsCollector:
                 AND name NOT LIKE '%리츠%'
                 AND name NOT LIKE '%ETF%'
                 ORDER BY code
-            """, conn)
+            """, self._conn)
             
         return df.to_dict('records')
     
@@ -764,12 +1024,12 @@ class StockNewsCollector:
     def get_existing_links_today(self) -> set:
         """오늘 수집된 뉴스 링크들 (중복 방지) - 수정 버전"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._db_lock:
                 df = pd.read_sql_query("""
                     SELECT DISTINCT link 
                     FROM news_articles 
                     WHERE DATE(collected_at) = DATE('now')
-                """, conn)
+                """, self._conn)
                 
                 # 🔧 수정: 안전한 set 반환
                 if not df.empty:
@@ -785,11 +1045,57 @@ class StockNewsCollector:
     # 1. collect_stock_news 함수에서 existing_links 처리 수정
     def collect_stock_news(self, stock: Dict[str, str]) -> List[Dict]:
         """특정 종목의 뉴스 수집 (오류 수정 버전)"""
+        collected_news = self._select_stock_news(stock)
+        
+        # 본문 수집
+        for news_data in collected_news:
+            news_data['content'] = self.content_extractor.extract_content(news_data['link'])
+        
+        if collected_news:
+            logger.info(f"[수집완료] {stock['name']}: {len(collected_news)}개 뉴스 수집 완료")
+        
+        return collected_news
+    
+    async def collect_stock_news_async(self, session, stock: Dict[str, str]) -> List[Dict]:
+        """특정 종목의 뉴스 비동기 수집 (검색 API는 스레드, 본문 요청은 동시에 처리)"""
+        # 검색 API 호출은 호출 제한 대기(time.sleep)가 있으므로 스레드에서 실행
+        collected_news = await asyncio.to_thread(self._select_stock_news, stock)
+        
+        contents = await asyncio.gather(*[
+            self.content_extractor.extract_content_async(session, news_data['link'])
+            for news_data in collected_news
+        ])
+        fetched_news = []
+        for news_data, content in zip(collected_news, contents):
+            if content is None:
+                # 요청 실패한 뉴스는 저장하지 않음 (link가 UNIQUE라 빈 본문으로 저장하면 다시 수집되지 않음)
+                # 공유 링크 목록에서도 빼서 다른 종목 검색 결과로 다시 요청할 수 있게 함
+                if self._existing_links is not None:
+                    with self._existing_links_lock:
+                        self._existing_links.discard(news_data['link'])
+                continue
+            
+            news_data['content'] = content
+            fetched_news.append(news_data)
+        collected_news = fetched_news
+        
+        if collected_news:
+            logger.info(f"[수집완료] {stock['name']}: {len(collected_news)}개 뉴스 수집 완료")
+        
+        return collected_news
+    
+    def _select_stock_news(self, stock: Dict[str, str]) -> List[Dict]:
+        """검색 API로 종목 관련 뉴스 선정 (본문은 비워 두고 호출한 쪽에서 수집)"""
         stock_code = stock['code']
         stock_name = stock['name']
         
         collected_news = []
-        existing_links = self.get_existing_links_today()  # set 형태로 가져오기
+        # 관련성 판단에 쓰는 종목명 조각 (뉴스마다 다시 나누지 않도록 종목당 한 번 계산)
+        name_parts = [part for part in stock_name.split() if len(part) > 1]
+        existing_links = self._existing_links
+        if existing_links is None:
+            # 단독 호출 시에는 DB에서 오늘 수집된 링크 조회
+            existing_links = self.get_existing_links_today()  # set 형태로 가져오기
         
         # 검색 전략: 종목명 + 키워드 조합
         search_strategies = [
@@ -821,12 +1127,15 @@ class StockNewsCollector:
                     continue
                 
                 # 종목 관련성 체크
-                title = re.sub(r'<[^>]+>', '', item['title'])
-                description = re.sub(r'<[^>]+>', '', item['description'])
+                title = HTML_TAG_RE.sub('', item['title'])
+                description = HTML_TAG_RE.sub('', item['description'])
                 
-                if self._is_relevant_news(title, description, stock_name, stock_code):
-                    # 본문 수집
-                    content = self.content_extractor.extract_content(item['link'])
+                if self._is_relevant_news(title, description, stock_name, stock_code, name_parts):
+                    # 다른 종목 스레드가 같은 링크를 먼저 선정했으면 건너뜀 (확인과 추가를 한 번에)
+                    with self._existing_links_lock:
+                        if item['link'] in existing_links:
+                            continue
+                        existing_links.add(item['link'])
                     
                     news_data = {
                         'stock_code': stock_code,
@@ -834,24 +1143,20 @@ class StockNewsCollector:
                         'title': title,
                         'link': item['link'],
                         'description': description,
-                        'content': content,
+                        'content': '',
                         'pub_date': item['pubDate'],
                         'source': self._extract_source(item.get('originallink', item['link']))
                     }
                     
                     collected_news.append(news_data)
-                    # 🔧 수정: 새로운 set 생성하여 할당
-                    existing_links = existing_links | {item['link']}  # 집합 합집합 연산
             
             time.sleep(0.1)
         
-        if collected_news:
-            logger.info(f"[수집완료] {stock_name}: {len(collected_news)}개 뉴스 수집 완료")
-        
         return collected_news
     
-    def _is_relevant_news(self, title: str, description: str, stock_name: str, stock_code: str) -> bool:
-        """뉴스의 종목 관련성 체크"""
+    def _is_relevant_news(self, title: str, description: str, stock_name: str, stock_code: str,
+                          name_parts: Optional[List[str]] = None) -> bool:
+        """뉴스의 종목 관련성 체크 (name_parts: 미리 나눈 두 글자 이상 종목명 조각)"""
         # 종목명 직접 포함
         if stock_name in title or stock_code in title:
             return True
@@ -860,13 +1165,14 @@ class StockNewsCollector:
         if stock_name in description:
             return True
         
-        # 주식 관련 키워드 + 종목명 일부
-        stock_keywords = ['주가', '실적', '재무', '매출', '영업이익', '투자', '상장', '공시', '배당']
-        text_combined = f"{title} {description}".lower()
+        # 주식 관련 키워드 + 종목명 일부 (키워드는 한글이라 소문자 변환 전에 한 번의 탐색으로 확인)
+        text_combined = f"{title} {description}"
         
-        if any(keyword in text_combined for keyword in stock_keywords):
-            name_parts = stock_name.split()
-            if any(part in text_combined for part in name_parts if len(part) > 1):
+        if STOCK_KEYWORD_RE.search(text_combined):
+            if name_parts is None:
+                name_parts = [part for part in stock_name.split() if len(part) > 1]
+            text_combined = text_combined.lower()
+            if any(part in text_combined for part in name_parts):
                 return True
         
         return False
@@ -905,35 +1211,46 @@ class StockNewsCollector:
         if not news_list:
             return 0
         
-        with sqlite3.connect(self.db_path) as conn:
+        insert_sql = '''
+            INSERT OR IGNORE INTO news_articles 
+            (stock_code, stock_name, title, link, description, content, pub_date, source)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        '''
+        rows = [
+            (
+                news.get('stock_code', ''),
+                news.get('stock_name', ''),
+                news.get('title', ''),
+                news.get('link', ''),
+                news.get('description', ''),
+                news.get('content', ''),
+                news.get('pub_date', ''),
+                news.get('source', '')
+            )
+            for news in news_list
+        ]
+        
+        with self._transaction() as conn:
             cursor = conn.cursor()
-            saved_count = 0
+            cursor.execute('SAVEPOINT news_batch')
             
-            # 🔧 수정: 리스트 복사로 안전한 반복
-            for news in list(news_list):  # 리스트 복사
-                try:
-                    cursor.execute('''
-                        INSERT OR IGNORE INTO news_articles 
-                        (stock_code, stock_name, title, link, description, content, pub_date, source)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                    ''', (
-                        news.get('stock_code', ''),
-                        news.get('stock_name', ''),
-                        news.get('title', ''),
-                        news.get('link', ''),
-                        news.get('description', ''),
-                        news.get('content', ''),
-                        news.get('pub_date', ''),
-                        news.get('source', '')
-                    ))
-                    
-                    if cursor.rowcount > 0:
-                        saved_count += 1
-                        
-                except sqlite3.Error as e:
-                    logger.error(f"저장 실패 - {news.get('title', 'Unknown')}: {e}")
+            try:
+                # 한 번의 executemany로 일괄 저장 (rowcount는 실제로 추가된 행 수의 합계)
+                cursor.executemany(insert_sql, rows)
+                saved_count = cursor.rowcount
+            except sqlite3.Error as e:
+                # 일괄 저장이 실패하면 행 단위로 다시 시도해 문제 있는 뉴스만 건너뜀
+                logger.debug(f"일괄 저장 실패, 행 단위로 재시도: {e}")
+                cursor.execute('ROLLBACK TO news_batch')
+                saved_count = 0
+                for news, row in zip(news_list, rows):
+                    try:
+                        cursor.execute(insert_sql, row)
+                        saved_count += cursor.rowcount
+                    except sqlite3.Error as e:
+                        logger.error(f"저장 실패 - {news.get('title', 'Unknown')}: {e}")
             
-            conn.commit()
+            cursor.execute('RELEASE news_batch')
             
         return saved_count
     
@@ -962,59 +1279,87 @@ class StockNewsCollector:
         
         total_collected = 0
         total_saved = 0
-        
-        with tqdm(total=len(stocks), desc="뉴스 수집 진행", unit="종목") as pbar:
-            
-            for i in range(0, len(stocks), batch_size):
-                # 🔧 수정: 배치 복사로 안전한 처리
-                batch = stocks[i:i + batch_size].copy()  # 복사본 생성
-                batch_news = []
+        batch_news = []
+        
+        def record_result(stock, news_list, error):
+            """종목 하나의 수집 결과 반영 (진행률/누적 건수)"""
+            nonlocal total_collected
+            if error is None:
+                if news_list:
+                    batch_news.extend(news_list)
+                    total_collected += len(news_list)
                 
-                if self.api_manager.api_calls_today >= self.api_manager.max_calls_per_day:
-                    logger.warning("[경고] 일일 API 호출 제한 도달, 수집 중단")
-                    break
-                
-                logger.info(f"[배치처리] 배치 {i//batch_size + 1}/{(len(stocks)-1)//batch_size + 1} 처리 중...")
+                pbar.set_postfix({
+                    'API호출': f"{self.api_manager.api_calls_today:,}",
+                    '수집': f"{total_collected:,}",
+                    '저장': f"{total_saved:,}"
+                })
+            else:
+                logger.error(f"[오류] {stock['name']} 처리 실패: {error}")
+            
+            pbar.update(1)
+        
+        # 오늘 수집된 링크는 한 번만 조회하고 이후 선정된 링크는 종목 간에 공유
+        self._existing_links = self.get_existing_links_today()
+        
+        loop = session = None
+        if aiohttp is not None:
+            # 하나의 이벤트 루프와 aiohttp 세션(연결 풀)을 모든 배치에서 재사용
+            loop = asyncio.new_event_loop()
+            session = loop.run_until_complete(self._open_async_session())
+        
+        try:
+            with tqdm(total=len(stocks), desc="뉴스 수집 진행", unit="종목") as pbar:
                 
-                with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                    # 🔧 수정: 딕셔너리 크기 변경 방지
-                    future_to_stock = {}
+                for i in range(0, len(stocks), batch_size):
+                    # 🔧 수정: 배치 복사로 안전한 처리
+                    batch = stocks[i:i + batch_size].copy()  # 복사본 생성
+                    batch_news = []
                     
-                    for stock in batch:
-                        future = executor.submit(self.collect_stock_news, stock)
-                        future_to_stock[future] = stock.copy()  # 주식 정보 복사
+                    if self.api_manager.api_calls_today >= self.api_manager.max_calls_per_day:
+                        logger.warning("[경고] 일일 API 호출 제한 도달, 수집 중단")
+                        break
                     
-                    # 🔧 수정: as_completed 결과를 리스트로 변환
-                    completed_futures = list(as_completed(future_to_stock))
+                    logger.info(f"[배치처리] 배치 {i//batch_size + 1}/{(len(stocks)-1)//batch_size + 1} 처리 중...")
                     
-                    for future in completed_futures:
-                        stock = future_to_stock[future]
-                        try:
-                            news_list = future.result()
-                            if news_list:
-                                batch_news.extend(news_list)
-                                total_collected += len(news_list)
+                    if loop is not None:
+                        # 종목 max_workers개를 동시에 처리하고 본문 요청은 공유 세션으로 한꺼번에 전송
+                        loop.run_until_complete(
+                            self._collect_batch_async(session, batch, max_workers, record_result)
+                        )
+                    else:
+                        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                            # 🔧 수정: 딕셔너리 크기 변경 방지
+                            future_to_stock = {}
                             
-                            pbar.set_postfix({
-                                'API호출': f"{self.api_manager.api_calls_today:,}",
-                                '수집': f"{total_collected:,}",
-                                '저장': f"{total_saved:,}"
-                            })
+                            for stock in batch:
+                                future = executor.submit(self.collect_stock_news, stock)
+                                future_to_stock[future] = stock.copy()  # 주식 정보 복사
                             
-                        except Exception as e:
-                            logger.error(f"[오류] {stock['name']} 처리 실패: {e}")
-                        
-                        pbar.update(1)
-                
-                # 배치 저장
-                if batch_news:
-                    saved_count = self.save_news_batch(batch_news)
-                    total_saved += saved_count
-                    logger.info(f"[배치저장] 배치 저장: {len(batch_news)}개 수집 -> {saved_count}개 신규 저장")
-                
-                # 배치 간 대기
-                if i + batch_size < len(stocks):
-                    time.sleep(10)
+                            # 🔧 수정: as_completed 결과를 리스트로 변환
+                            completed_futures = list(as_completed(future_to_stock))
+                            
+                            for future in completed_futures:
+                                stock = future_to_stock[future]
+                                try:
+                                    record_result(stock, future.result(), None)
+                                except Exception as e:
+                                    record_result(stock, [], e)
+                    
+                    # 배치 저장
+                    if batch_news:
+                        saved_count = self.save_news_batch(batch_news)
+                        total_saved += saved_count
+                        logger.info(f"[배치저장] 배치 저장: {len(batch_news)}개 수집 -> {saved_count}개 신규 저장")
+                    
+                    # 배치 간 대기
+                    if i + batch_size < len(stocks):
+                        time.sleep(10)
+        finally:
+            self._existing_links = None
+            if loop is not None:
+                loop.run_until_complete(session.close())
+                loop.close()
         
         logger.info(f"[완료] 전체 수집 완료!")
         logger.info(f"[결과] 최종 결과: {total_collected:,}개 수집, {total_saved:,}개 저장")
@@ -1022,6 +1367,25 @@ class StockNewsCollector:
         
         self.print_collection_summary()
     
+    async def _open_async_session(self):
+        """본문 수집용 aiohttp 세션 생성 (세션은 실행 중인 이벤트 루프 안에서 만들어야 함)"""
+        return self.content_extractor.async_session(self.ASYNC_CONNECTION_LIMIT)
+    
+    async def _collect_batch_async(self, session, batch: List[Dict], max_workers: int, record_result):
+        """⚡ 배치 내 종목 비동기 수집 (완료된 종목부터 record_result로 결과 반영)"""
+        semaphore = asyncio.Semaphore(max_workers)
+        
+        async def worker(stock):
+            try:
+                async with semaphore:
+                    news_list = await self.collect_stock_news_async(session, stock)
+                return stock, news_list, None
+            except Exception as e:
+                return stock, [], e
+        
+        for next_done in asyncio.as_completed([worker(stock) for stock in batch]):
+            record_result(*await next_done)
+    
     def print_quality_summary(self):
         """🆕 품질 검증 결과 요약 출력"""
         stats = self.quality_stats
@@ -1043,7 +1407,7 @@ class StockNewsCollector:
     
     def print_collection_summary(self):
         """수집 결과 요약 출력"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._db_lock:
             # 오늘 수집 통계 (품질별)
             today_stats = pd.read_sql_query("""
                 SELECT 
@@ -1055,7 +1419,7 @@ class StockNewsCollector:
                     COUNT(CASE WHEN quality_score >= 80 THEN 1 END) as high_quality_count
                 FROM news_articles 
                 WHERE DATE(collected_at) = DATE('now')
-            """, conn).iloc[0]
+            """, self._conn).iloc[0]
             
             # 소스별 통계
             source_stats = pd.read_sql_query("""
@@ -1065,7 +1429,7 @@ class StockNewsCollector:
                 GROUP BY source
                 ORDER BY avg_quality DESC, count DESC
                 LIMIT 5
-            """, conn)
+            """, self._conn)
             
             # 종목별 뉴스 수 TOP 5
             stock_stats = pd.read_sql_query("""
@@ -1075,7 +1439,7 @@ class StockNewsCollector:
                 GROUP BY stock_code, stock_name
                 ORDER BY news_count DESC
                 LIMIT 5
-            """, conn)
+            """, self._conn)
         
         print(f"\n[수집요약] 오늘 수집 요약:")
         print(f"  • 총 뉴스: {today_stats['total_news']:,}개")